@@ -1,19 +1,58 @@
+import asyncio
+import hashlib
 import logging
 import os
+import time
 from typing import List, Optional, Dict, Any
+from functools import lru_cache
 from models.schemas import StructuredCompanyDoc, Section, Citation, RawDoc
 from utils.web_scraper import WebScraper
+from utils.http_session import get_http_session
 from utils.nlp import NLExtractor
 from utils.google_search import search_google
-from agents.founder_profiler import evaluate_founder
+from agents.founder_profiler import evaluate_founder, get_founder_team_info
 from agents.market_mapper import map_market
 from llm.section_extractor import extract_sections_with_gpt
 from agents.pitchdeck_parser import parse_pitch_deck, get_pitch_deck_summary
 from datetime import datetime
 import re
+import requests
 
 logger = logging.getLogger(__name__)
 
+# On-disk cache of company analyses, keyed by a hash of company, website and founder.
+# Entries older than the TTL are re-analyzed; set COMPANY_CACHE_DISABLED=1 to bypass the cache.
+COMPANY_CACHE_DIR = os.getenv("COMPANY_CACHE_DIR", os.path.join("cache", "companies"))
+COMPANY_CACHE_TTL_SECONDS = int(os.getenv("COMPANY_CACHE_TTL_SECONDS", str(24 * 60 * 60)))
+
+def _company_cache_enabled() -> bool:
+    return os.getenv("COMPANY_CACHE_DISABLED", "").lower() not in ("1", "true", "yes")
+
+def _company_cache_path(company_name: str, website: Optional[str], founder_name: Optional[str]) -> str:
+    cache_key = hashlib.sha256(f"{company_name}|{website or ''}|{founder_name or ''}".encode()).hexdigest()
+    return os.path.join(COMPANY_CACHE_DIR, f"{cache_key}.json")
+
+def _load_cached_company(cache_path: str) -> Optional[StructuredCompanyDoc]:
+    """Return a cached company analysis if present and within the TTL"""
+    try:
+        if time.time() - os.path.getmtime(cache_path) > COMPANY_CACHE_TTL_SECONDS:
+            return None
+        with open(cache_path, 'r') as f:
+            return StructuredCompanyDoc.model_validate_json(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to load cached company analysis {cache_path}: {e}")
+        return None
+
+def _store_cached_company(cache_path: str, company_doc: StructuredCompanyDoc) -> None:
+    try:
+        os.makedirs(COMPANY_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'w') as f:
+            f.write(company_doc.model_dump_json())
+    except Exception as e:
+        logger.warning(f"Failed to cache company analysis {cache_path}: {e}")
+
 def is_high_quality_source(url: str, title: str = "") -> bool:
     """Return True if the source is a high-quality, verifiable source"""
     url_lower = url.lower()
@@ -73,14 +112,19 @@ def is_acceptable_source(url: str, title: str = "", company_name: str = "") -> b
     # Accept most domains that mention the company
     return True
 
+@lru_cache(maxsize=1)
+def _get_openai_client():
+    """Return a shared OpenAI client so its HTTP connection pool is reused across calls"""
+    from openai import OpenAI
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
 def extract_structured_data_from_sources(sources: List[Dict], company_name: str) -> Dict[str, Any]:
     """
     Extract structured data from verified sources using GPT-4.
     Focus on real, verifiable information only.
     """
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        client = _get_openai_client()
         
         # Prepare source data for analysis
         source_text = ""
@@ -201,6 +245,40 @@ def extract_structured_data_from_sources(sources: List[Dict], company_name: str)
         logger.error(f"Failed to extract structured data for {company_name}: {e}")
         return {}
 
+# Google queries run at once per company; each one also fetches its top results
+MAX_CONCURRENT_SEARCHES = int(os.getenv("MAX_CONCURRENT_SEARCHES", "6"))
+
+async def run_searches(company_name: str, queries: List[str], session: Optional[requests.Session] = None) -> List[List[Dict]]:
+    """
+    Run the Google queries for a company concurrently, at most MAX_CONCURRENT_SEARCHES at a time.
+    Each search and its page fetches are blocking I/O, so overlapping them makes the total
+    latency close to the slowest few queries rather than the sum of all of them.
+    Returns each query's results in query order, or the exception it raised.
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+    
+    async def search(query):
+        async with sem:
+            return await asyncio.to_thread(search_google, company_name, [query], session)
+    
+    return await asyncio.gather(*(search(query) for query in queries), return_exceptions=True)
+
+async def gather_team_and_market(company_name: str, docs: List[RawDoc] = None) -> Dict[str, Any]:
+    """
+    Research the founding team and the market for a company concurrently.
+
+    Both lookups are independent network-bound calls, so running them side by
+    side makes the total latency that of the slower one instead of their sum.
+    """
+    team, market = await asyncio.gather(
+        asyncio.to_thread(get_founder_team_info, company_name),
+        asyncio.to_thread(map_market, {'company': company_name}, docs)
+    )
+    return {
+        "team": team,
+        "market": market
+    }
+
 def detect_fake_data(data: Dict) -> Dict:
     """Detect and clean fake data from GPT response"""
     
@@ -291,8 +369,10 @@ def detect_fake_data(data: Dict) -> Dict:
     return cleaned_data
 
 class CompanyResearcher:
-    def __init__(self):
-        self.scraper = WebScraper()
+    def __init__(self, session: Optional[requests.Session] = None):
+        # One pooled session for website fetches and SerpAPI searches alike
+        self.session = session or get_http_session()
+        self.scraper = WebScraper(session=self.session)
         self.nlp = NLExtractor()
     
     def search_verifiable_sources(self, company_name: str) -> List[Dict]:
@@ -356,10 +436,11 @@ class CompanyResearcher:
         high_quality_sources = []
         
         try:
-            # Perform searches
-            for query in search_queries:
+            # Perform searches concurrently, then handle the results in query order
+            for query, results in zip(search_queries, asyncio.run(run_searches(company_name, search_queries, self.session))):
                 try:
-                    results = search_google(company_name, [query])
+                    if isinstance(results, Exception):
+                        raise results
                     if results:
                         # Separate high-quality and acceptable sources
                         for result in results:
@@ -428,6 +509,8 @@ class CompanyResearcher:
     def _create_insufficient_data_memo(self, company_name: str) -> StructuredCompanyDoc:
         """Create a memo indicating insufficient public data"""
         company_doc = StructuredCompanyDoc(name=company_name)
+        # Callers must not mistake this placeholder for a successful analysis
+        company_doc._is_fallback = True
         
         # Create sections indicating insufficient data
         insufficient_text = f"Insufficient public data available for {company_name}. This could be an early-stage startup with limited online presence, or the company may be using a different name."
@@ -733,10 +816,23 @@ class CompanyResearcher:
     
     def analyze_company(self, company_name: str, website: str = None, founder_name: str = None) -> StructuredCompanyDoc:
         """Main method to analyze a company with focus on verifiable data"""
+        cache_path = _company_cache_path(company_name, website, founder_name) if _company_cache_enabled() else None
+        if cache_path:
+            cached = _load_cached_company(cache_path)
+            if cached is not None:
+                logger.info(f"Using cached analysis of {company_name}")
+                return cached
+        
         logger.info(f"Starting verifiable analysis of {company_name}")
         
         # Use the new verifiable memo creation
-        return self.create_verifiable_memo(company_name)
+        company_doc = self.create_verifiable_memo(company_name)
+        
+        # Failed analyses come back empty or as an insufficient-data placeholder; don't cache
+        # either, so the next call retries instead of serving the failure for the whole TTL
+        if cache_path and not company_doc.is_fallback and company_doc.get_populated_sections():
+            _store_cached_company(cache_path, company_doc)
+        return company_doc
 
     def analyze_pitch_deck(self, pdf_path: str, company_name: str = None) -> StructuredCompanyDoc:
         """
@@ -779,8 +875,7 @@ class CompanyResearcher:
         This mimics ChatGPT's ability to provide information from its training data.
         """
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            client = _get_openai_client()
             
             prompt = f"""
             You are a professional VC analyst. Provide comprehensive information about {company_name} based on your training data.
@@ -891,3 +986,33 @@ class CompanyResearcher:
         except Exception as e:
             logger.error(f"Failed to generate memo from GPT knowledge for {company_name}: {e}")
             return self._create_insufficient_data_memo(company_name)
+
+async def analyze_company_with_team_and_market(company_name: str, website: str = None,
+                                               founder_name: str = None) -> StructuredCompanyDoc:
+    """
+    Analyze a company while the team and market agents run alongside it, then fill the
+    team, market and competitors sections the analysis left empty from their findings.
+    """
+    company_doc, team_and_market = await asyncio.gather(
+        asyncio.to_thread(get_researcher().analyze_company, company_name, website, founder_name),
+        gather_team_and_market(company_name),
+        return_exceptions=True
+    )
+    if isinstance(company_doc, BaseException):
+        raise company_doc
+    if isinstance(team_and_market, BaseException):
+        logger.warning(f"Team and market research failed for {company_name}: {team_and_market}")
+        return company_doc
+    
+    market = team_and_market["market"]
+    for field_name, section in (("team", team_and_market["team"]),
+                                ("market", market["market_sizing"]),
+                                ("competitors", market["competition"])):
+        if section.has_content() and not getattr(company_doc, field_name).has_content():
+            setattr(company_doc, field_name, section)
+    return company_doc
+
+@lru_cache(maxsize=1)
+def get_researcher() -> CompanyResearcher:
+    """Return a shared CompanyResearcher so its scraper sessions are reused across analyses"""
+    return CompanyResearcher()
@@ -64,8 +64,10 @@ class EnhancedAnalyzer:
                         "content": prompt
                     }
                 ],
-                temperature=0.3,
-                max_tokens=4000
+                # Deterministic JSON-mode output, so the reply parses directly and repeat runs agree
+                temperature=0,
+                max_tokens=4000,
+                response_format={"type": "json_object"}
             )
             
             content = response.choices[0].message.content.strip()
@@ -83,12 +85,12 @@ class EnhancedAnalyzer:
     def _create_comprehensive_prompt(self, slides_data: List[Dict], company_name: str) -> str:
         """Create a comprehensive prompt for GPT-4 analysis"""
         
-        # Combine all slide content
+        # Combine all slide content into one request, each slide behind its own marker
         all_content = []
         for i, slide in enumerate(slides_data, 1):
             slide_text = slide.get('text', '').strip()
             if slide_text:
-                all_content.append(f"Slide {i}:\n{slide_text}\n")
+                all_content.append(f"---SLIDE {i}---\n{slide_text}\n")
         
         combined_content = "\n".join(all_content)
         
@@ -2,20 +2,104 @@ import logging
 from typing import List, Dict, Optional
 from models.schemas import Section, Citation
 from utils.linkedin_scraper import extract_team_from_linkedin
-from datetime import datetime
+from utils.run_context import run_timestamp
+from functools import lru_cache
 import os
-import openai
+import threading
+from concurrent.futures import Future
+from openai import OpenAI
 import json
 
 logger = logging.getLogger(__name__)
 
+TEAM_SUMMARY_SYSTEM_PROMPT = """You are a professional VC analyst creating an investment memo. Provide concise, factual team summaries suitable for investment memos.
+
+You will receive a company name followed by a JSON list of extracted team members.
+
+Write a professional summary paragraph and 3-5 bullet points about the founding team and leadership.
+
+Focus on:
+- Founder experience and background
+- Previous exits or successful companies
+- Relevant industry experience
+- Credibility and track record
+- Key leadership roles and responsibilities
+
+Keep the tone professional and analytical, suitable for an investment memo.
+
+Return as JSON:
+{
+  "text": "Professional summary paragraph...",
+  "bullets": ["Bullet point 1", "Bullet point 2", "..."],
+  "citations": ["url1", "url2", "..."]
+}
+"""
+
+# Caps concurrent GPT-4 calls (e.g. from fanned-out team lookups) to stay within rate limits
+_openai_semaphore = threading.BoundedSemaphore(int(os.getenv("OPENAI_MAX_CONCURRENCY", "4")))
+
+@lru_cache(maxsize=1)
+def _get_openai_client() -> OpenAI:
+    """Return a shared OpenAI client so its HTTP connection pool is reused across calls"""
+    return OpenAI(max_retries=3, timeout=60.0)
+
+# Companies remembered by each per-company cache below; the oldest entry is evicted first
+MAX_CACHED_COMPANIES = 64
+
+def _remember(cache: Dict, key: str, value) -> None:
+    """Add an entry to a bounded cache; the caller must hold the cache's lock"""
+    if key not in cache and len(cache) >= MAX_CACHED_COMPANIES:
+        cache.pop(next(iter(cache)), None)
+    cache[key] = value
+
+# LinkedIn scrapes shared between get_founder_team_info and evaluate_founder. The lock only
+# guards these dicts; scrapes run outside it, and concurrent callers for the same company
+# wait on the in-flight scrape's future instead of starting their own.
+_linkedin_team_cache: Dict[str, List[Dict[str, str]]] = {}
+_linkedin_team_inflight: Dict[str, Future] = {}
+_linkedin_team_lock = threading.Lock()
+
+def _get_linkedin_team_once(company_name: str) -> List[Dict[str, str]]:
+    """Scrape LinkedIn for a company at most once, reusing the team on later calls"""
+    with _linkedin_team_lock:
+        team = _linkedin_team_cache.get(company_name)
+        if team is not None:
+            return list(team)
+        future = _linkedin_team_inflight.get(company_name)
+        is_owner = future is None
+        if is_owner:
+            future = _linkedin_team_inflight[company_name] = Future()
+    
+    if not is_owner:
+        return list(future.result())
+    
+    try:
+        team = extract_team_from_linkedin(company_name) or []
+    except BaseException as e:
+        with _linkedin_team_lock:
+            del _linkedin_team_inflight[company_name]
+        future.set_exception(e)
+        raise
+    
+    with _linkedin_team_lock:
+        del _linkedin_team_inflight[company_name]
+        # Don't remember failed or empty scrapes so later calls can retry
+        if team:
+            _remember(_linkedin_team_cache, company_name, team)
+    future.set_result(team)
+    return list(team)
+
+# GPT-4 team summaries by company, so repeat lookups skip the scrape and the API call
+_team_info_cache: Dict[str, Section] = {}
+_team_info_lock = threading.Lock()
+
 def create_linkedin_citation(team_member: dict) -> Citation:
     """Create a citation from a LinkedIn team member"""
     return Citation(
         url=team_member['source'],
         snippet=f"{team_member['name']} — {team_member['title']}",
         source_type="linkedin",
-        timestamp=datetime.now()
+        timestamp=run_timestamp()
     )
 
 def get_founder_team_info(company_name: str) -> Section:
@@ -29,6 +113,12 @@ def get_founder_team_info(company_name: str) -> Section:
         Section object with team summary, bullets, and citations
     """
     logger.info(f"Getting founder/team info for {company_name}")
+    with _team_info_lock:
+        cached = _team_info_cache.get(company_name)
+    if cached is not None:
+        logger.info(f"Using cached team summary for {company_name}")
+        # Callers may edit the section, so never hand out the cached instance
+        return cached.model_copy(deep=True)
     
     # Step 1: LinkedIn Scraping
     team_members = []
@@ -36,7 +126,7 @@ def get_founder_team_info(company_name: str) -> Section:
     
     try:
         logger.info(f"Scraping LinkedIn for {company_name} team members")
-        linkedin_team = extract_team_from_linkedin(company_name)
+        linkedin_team = _get_linkedin_team_once(company_name)
         
         if linkedin_team:
             team_members.extend(linkedin_team)
@@ -67,32 +157,8 @@ def get_founder_team_info(company_name: str) -> Section:
                     "source": member.get('source', 'Unknown')
                 })
             
-            # Create GPT-4 prompt
-            prompt = f"""
-You are a VC analyst creating an investment memo.
-
-Based on the following extracted team info for {company_name}:
-
-{json.dumps(team_info_raw, indent=2)}
-
-Write a professional summary paragraph and 3-5 bullet points about the founding team and leadership.
-
-Focus on:
-- Founder experience and background
-- Previous exits or successful companies
-- Relevant industry experience
-- Credibility and track record
-- Key leadership roles and responsibilities
-
-Keep the tone professional and analytical, suitable for an investment memo.
-
-Return as JSON:
-{{
-  "text": "Professional summary paragraph...",
-  "bullets": ["Bullet point 1", "Bullet point 2", "..."],
-  "citations": ["url1", "url2", "..."]
-}}
-"""
+            # Only the per-company data varies; the instructions live in the static system prompt
+            prompt = f"{company_name}: {json.dumps(team_info_raw)}"
             
             # Check if OpenAI API key is available
             if not os.getenv("OPENAI_API_KEY"):
@@ -100,67 +166,54 @@ Return as JSON:
                 return create_fallback_team_section(company_name, team_members, linkedin_citations)
             
             # Call GPT-4
-            response = openai.ChatCompletion.create(
-                model="gpt-4-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a professional VC analyst. Provide concise, factual team summaries suitable for investment memos."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,
-                max_tokens=500
+            with _openai_semaphore:
+                response = _get_openai_client().chat.completions.create(
+                    model="gpt-4-turbo",
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": TEAM_SUMMARY_SYSTEM_PROMPT
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    temperature=0.3,
+                    max_tokens=300,
+                    response_format={"type": "json_object"}
+                )
+            
+            # JSON mode guarantees the reply is a single JSON object
+            result = json.loads(response.choices[0].message.content)
+            
+            # Create citations
+            citations = []
+            if 'citations' in result:
+                for url in result['citations']:
+                    citations.append(Citation(
+                        url=url,
+                        snippet=f"Team information source",
+                        source_type="website",
+                        timestamp=run_timestamp()
+                    ))
+            
+            # Add LinkedIn citations
+            citations.extend(linkedin_citations)
+            
+            # Create Section object
+            section = Section(
+                text=result.get('text', ''),
+                bullets=result.get('bullets', []),
+                citations=citations
             )
             
-            # Parse GPT-4 response
-            content = response.choices[0].message.content.strip()
+            logger.info(f"Successfully generated team summary for {company_name}")
+            # Only remember real summaries; fallbacks are retried on the next call
+            with _team_info_lock:
+                _remember(_team_info_cache, company_name, section.model_copy(deep=True))
+            return section
             
-            try:
-                # Extract JSON from response
-                if content.startswith('{') and content.endswith('}'):
-                    result = json.loads(content)
-                else:
-                    # Try to find JSON within the response
-                    start_idx = content.find('{')
-                    end_idx = content.rfind('}') + 1
-                    if start_idx != -1 and end_idx > start_idx:
-                        json_str = content[start_idx:end_idx]
-                        result = json.loads(json_str)
-                    else:
-                        raise ValueError("No valid JSON found in response")
-                
-                # Create citations
-                citations = []
-                if 'citations' in result:
-                    for url in result['citations']:
-                        citations.append(Citation(
-                            url=url,
-                            snippet=f"Team information source",
-                            source_type="website",
-                            timestamp=datetime.now()
-                        ))
-                
-                # Add LinkedIn citations
-                citations.extend(linkedin_citations)
-                
-                # Create Section object
-                section = Section(
-                    text=result.get('text', ''),
-                    bullets=result.get('bullets', []),
-                    citations=citations
-                )
-                
-                logger.info(f"Successfully generated team summary for {company_name}")
-                return section
-                
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Failed to parse GPT-4 response for {company_name}: {e}")
-                return create_fallback_team_section(company_name, team_members, linkedin_citations)
-                
         except Exception as e:
             logger.warning(f"GPT-4 summarization failed for {company_name}: {e}")
             return create_fallback_team_section(company_name, team_members, linkedin_citations)
@@ -197,13 +250,12 @@ def create_fallback_team_section(company_name: str, team_members: List[Dict], ci
 
 def evaluate_founder(founder_name: str, company_name: str = None) -> Dict:
     """Evaluate founder and team using LinkedIn data when available"""
-
     # Try to get real team data from LinkedIn
     linkedin_team = []
     if company_name:
         try:
             logger.info(f"Extracting team information from LinkedIn for {company_name}")
-            linkedin_team = extract_team_from_linkedin(company_name)
+            linkedin_team = _get_linkedin_team_once(company_name)
             logger.info(f"Found {len(linkedin_team)} team members from LinkedIn")
         except Exception as e:
             logger.warning(f"LinkedIn extraction failed for {company_name}: {e}")
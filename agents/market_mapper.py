@@ -1,9 +1,10 @@
+import bisect
 import logging
 import re
 from typing import List, Dict, Optional
 from models.schemas import Section, Citation, RawDoc
 from utils.google_search import search_google
-from datetime import datetime
+from utils.run_context import run_timestamp
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,19 @@ class MarketMapper:
             r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*(?:Inc|Corp|LLC|Ltd|Company|Co)\b',
             r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*(?:is|are|was|were)\s*([^\.]+)',
         ]
+        
+        # All market size patterns as one alternation so the text is scanned once
+        self.market_size_regex = re.compile(
+            '|'.join(f'(?P<size{i}>{pattern})' for i, pattern in enumerate(self.market_size_patterns)),
+            re.IGNORECASE
+        )
+        
+        # Competition patterns are scanned separately: merged into one alternation with the
+        # name pattern, a capitalized name ("Major Competitors") would swallow the keyword
+        self.competition_regexes = [re.compile(pattern, re.IGNORECASE) for pattern in self.competition_patterns]
+        self.company_name_regex = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b')
+        self.sentence_end_regex = re.compile(r'[.!?]+')
+        self.competitor_keywords = ['competitor', 'alternative', 'similar', 'compete']
     
     def create_citation(self, raw_doc: RawDoc, snippet: str) -> Citation:
         """Create a citation from a raw document"""
@@ -47,26 +61,23 @@ class MarketMapper:
             url=result['url'],
             snippet=result['snippet'][:200] + "..." if len(result['snippet']) > 200 else result['snippet'],
             source_type="google_search",
-            timestamp=datetime.now()
+            timestamp=run_timestamp()
         )
     
     def extract_market_size(self, text: str, citations: List[Citation]) -> Optional[Section]:
         """Extract market size information from text"""
         market_sizes = []
         
-        for pattern in self.market_size_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if len(match.groups()) >= 2:
-                    # Extract the full sentence containing the match
-                    sentence_start = text.rfind('.', 0, match.start()) + 1
-                    sentence_end = text.find('.', match.end())
-                    if sentence_end == -1:
-                        sentence_end = len(text)
-                    
-                    sentence = text[sentence_start:sentence_end].strip()
-                    if len(sentence) > 20:
-                        market_sizes.append(sentence)
+        for match in self.market_size_regex.finditer(text):
+            # Extract the full sentence containing the match
+            sentence_start = text.rfind('.', 0, match.start()) + 1
+            sentence_end = text.find('.', match.end())
+            if sentence_end == -1:
+                sentence_end = len(text)
+            
+            sentence = text[sentence_start:sentence_end].strip()
+            if len(sentence) > 20 and sentence not in market_sizes:
+                market_sizes.append(sentence)
         
         if market_sizes:
             return Section(
@@ -80,37 +91,47 @@ class MarketMapper:
         """Extract competitor information from text"""
         competitors = []
         
+        def is_multi_word(name: str) -> bool:
+            return len(name.split()) >= 2  # At least 2 words (first + last name)
+        
         # Look for competitor mentions
-        for pattern in self.competition_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if len(match.groups()) >= 2:
-                    # Extract competitor names and context
-                    competitor_text = match.group(0)
+        for regex in self.competition_regexes:
+            for match in regex.finditer(text):
+                competitor_text = match.group(0)
+                
+                # Look for specific company names in the competitor text
+                for company_match in self.company_name_regex.finditer(competitor_text):
+                    if not is_multi_word(company_match.group(1)):
+                        continue
+                    
+                    # Get context around the company name
+                    context_start = max(0, company_match.start() - 50)
+                    context_end = min(len(competitor_text), company_match.end() + 50)
+                    context = competitor_text[context_start:context_end].strip()
                     
-                    # Look for specific company names in the competitor text
-                    company_matches = re.finditer(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b', competitor_text)
-                    for company_match in company_matches:
-                        company_name = company_match.group(1)
-                        if len(company_name.split()) >= 2:  # At least 2 words (first + last name)
-                            # Get context around the company name
-                            context_start = max(0, company_match.start() - 50)
-                            context_end = min(len(competitor_text), company_match.end() + 50)
-                            context = competitor_text[context_start:context_end].strip()
-                            
-                            if context not in competitors:
-                                competitors.append(context)
-        
-        # Also look for standalone company mentions with context
-        sentences = re.split(r'[.!?]+', text)
-        for sentence in sentences:
-            if any(word in sentence.lower() for word in ['competitor', 'alternative', 'similar', 'compete']):
-                # Extract company names from these sentences
-                company_matches = re.finditer(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b', sentence)
-                for company_match in company_matches:
-                    company_name = company_match.group(1)
-                    if len(company_name.split()) >= 2:
-                        competitors.append(sentence.strip())
+                    if context not in competitors:
+                        competitors.append(context)
+        
+        # (start, end) of every multi-word capitalized name in text
+        names = [match.span() for match in self.company_name_regex.finditer(text) if is_multi_word(match.group(1))]
+        
+        # Also look for standalone company mentions in sentences about competition
+        sentence_bounds = [(m.start(), m.end()) for m in self.sentence_end_regex.finditer(text)]
+        sentence_ends = [start for start, _ in sentence_bounds]
+        is_competitive = {}
+        
+        for name_start, _ in names:
+            index = bisect.bisect_right(sentence_ends, name_start)
+            if index not in is_competitive:
+                sentence_start = sentence_bounds[index - 1][1] if index else 0
+                sentence_end = sentence_ends[index] if index < len(sentence_ends) else len(text)
+                sentence = text[sentence_start:sentence_end]
+                is_competitive[index] = sentence if any(
+                    word in sentence.lower() for word in self.competitor_keywords
+                ) else None
+            
+            if is_competitive[index] is not None:
+                competitors.append(is_competitive[index].strip())
         
         if competitors:
             return Section(
@@ -1,297 +1,249 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from jinja2 import Template
-from models.schemas import StructuredCompanyDoc
+from functools import partial
+from itertools import chain
+from jinja2 import ChainableUndefined, DictLoader, Environment, FileSystemBytecodeCache
+from typing import Dict, Iterator, List, Optional
+from models.schemas import StructuredCompanyDoc, Section, Citation
 
-MEMO_TEMPLATE = """
-# {{ company.name }} Investment Memo
-Prepared on {{ date }}
-
-## Investment Recommendations
-
-{% if company.recommendations.has_content() %}
-{{ company.recommendations.text }}
-
-{% if company.recommendations.bullets %}
-**Key Decision Points:**
-{% for bullet in company.recommendations.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-**Investment Decision: [To be determined based on due diligence]**
-
-**Key Decision Points:**
-- Speed assessment pending
-- Depth evaluation required
-- Taste alignment to be verified
-- Influence potential needs validation
-{% endif %}
-
-{% if company.recommendations.citations %}
-**Sources:** {% for citation in company.recommendations.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
-
----
-
-## 1. Executive Summary
-{% if company.intro.has_content() %}
-{{ company.intro.text }}
-
-{% if company.intro.bullets %}
-**Key Points:**
-{% for bullet in company.intro.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-{{ company.name }} is a [industry] company that [brief description of what they do]. The company addresses [core problem] through [unique solution], serving [target market]. [Funding status if available].
-{% endif %}
-
-{% if company.intro.citations %}
-**Sources:** {% for citation in company.intro.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
-
-## 2. Company Overview
-{% if company.intro.has_content() %}
-{{ company.intro.text }}
-
-{% if company.intro.bullets %}
-**Key Milestones:**
-{% for bullet in company.intro.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-{{ company.name }} is a [industry] company focused on [core business area]. The company was founded to [mission/vision].
-{% endif %}
-
-{% if company.intro.citations %}
-**Sources:** {% for citation in company.intro.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
-
-## 3. Problem
-{% if company.problem.has_content() %}
-{{ company.problem.text }}
-
-{% if company.problem.bullets %}
-**Key Issues:**
-{% for bullet in company.problem.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-[Problem description not available - common for early-stage startups]
-{% endif %}
-
-{% if company.problem.citations %}
-**Sources:** {% for citation in company.problem.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
-
-## 4. Solution
-{% if company.solution.has_content() %}
-{{ company.solution.text }}
-
-{% if company.solution.bullets %}
-**Key Value Propositions:**
-{% for bullet in company.solution.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-[Solution details not available - common for early-stage startups]
-{% endif %}
-
-{% if company.solution.citations %}
-**Sources:** {% for citation in company.solution.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
-
-## 5. Product
-{% if company.product.has_content() %}
-{{ company.product.text }}
-
-{% if company.product.bullets %}
-**Key Features:**
-{% for bullet in company.product.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-[Product details not available - common for early-stage startups]
-{% endif %}
-
-{% if company.product.citations %}
-**Sources:** {% for citation in company.product.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
-
-## 6. Business Model
-{% if company.business_model.has_content() %}
-{{ company.business_model.text }}
-
-{% if company.business_model.bullets %}
-**Revenue Streams:**
-{% for bullet in company.business_model.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-[Business model details not available - common for early-stage startups]
-{% endif %}
-
-{% if company.business_model.citations %}
-**Sources:** {% for citation in company.business_model.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
+logger = logging.getLogger(__name__)
 
-## 7. Market Size
-{% if company.market.has_content() %}
-{{ company.market.text }}
+# Shared section macros, imported by the header and body templates
+MEMO_MACROS = """{% macro render_citations(section) %}
+{% if section["citations_md"] %}
 
-{% if company.market.bullets %}
-**Market Insights:**
-{% for bullet in company.market.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-[Market size data not available - common for early-stage startups]
+**Sources:** {{ section["citations_md"] }}
 {% endif %}
+{% endmacro %}
+{% macro render_section(section, fallback, bullet_label) %}
+{% if section["has_content"] %}
 
-{% if company.market.citations %}
-**Sources:** {% for citation in company.market.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
+{{ section["text"] }}
 
-## 8. Traction
-{% if company.traction.has_content() %}
-{{ company.traction.text }}
+{% if section["bullets_md"] %}
 
-{% if company.traction.bullets %}
-**Key Metrics:**
-{% for bullet in company.traction.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-[Traction data not available - common for early-stage startups]
-{% endif %}
+**{{ bullet_label }}:**
+{{ section["bullets_md"] }}
 
-{% if company.traction.citations %}
-**Sources:** {% for citation in company.traction.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
 {% endif %}
 
-## 9. Growth Strategy
-{% if company.growth_strategy.has_content() %}
-{{ company.growth_strategy.text }}
-
-{% if company.growth_strategy.bullets %}
-**Growth Tactics:**
-{% for bullet in company.growth_strategy.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
 {% else %}
-[Growth strategy details not available - common for early-stage startups]
-{% endif %}
 
-{% if company.growth_strategy.citations %}
-**Sources:** {% for citation in company.growth_strategy.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
+{{ fallback }}
 {% endif %}
 
-## 10. Team
-{% if company.team.has_content() %}
-{{ company.team.text }}
-
-{% if company.team.bullets %}
-**Key Team Members:**
-{% for bullet in company.team.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-[Team information not available - common for early-stage startups]
-{% endif %}
-
-{% if company.team.citations %}
-**Sources:** {% for citation in company.team.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
-
-## 11. Competition
-{% if company.competitors.has_content() %}
-{{ company.competitors.text }}
-
-{% if company.competitors.bullets %}
-**Key Competitors:**
-{% for bullet in company.competitors.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-[Competitive analysis not available - common for early-stage startups]
-{% endif %}
-
-{% if company.competitors.citations %}
-**Sources:** {% for citation in company.competitors.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
-
-## 12. Financials
-{% if company.financials.has_content() %}
-{{ company.financials.text }}
-
-{% if company.financials.bullets %}
-**Financial Metrics:**
-{% for bullet in company.financials.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-[Financial data not available - common for early-stage startups]
-{% endif %}
 
-{% if company.financials.citations %}
-**Sources:** {% for citation in company.financials.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
+{{ render_citations(section) }}
+{%- endmacro %}
+"""
 
-## 13. Risks
-{% if company.risks.has_content() %}
-{{ company.risks.text }}
+# Title, date and investment recommendations
+MEMO_HEADER_TEMPLATE = """{% from "memo_macros" import render_section %}
+{% set recommendations_fallback -%}
+**Investment Decision: [To be determined based on due diligence]**
 
-{% if company.risks.bullets %}
-**Potential Risk Factors:**
-{% for bullet in company.risks.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-[Risk assessment not available - common for early-stage startups]
-{% endif %}
+**Key Decision Points:**
+- Speed assessment pending
+- Depth evaluation required
+- Taste alignment to be verified
+- Influence potential needs validation
+{%- endset %}
 
-{% if company.risks.citations %}
-**Sources:** {% for citation in company.risks.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
+# {{ company["name"] }} Investment Memo
+Prepared on {{ date }}
 
-## 14. Timing
-{% if company.timing.has_content() %}
-{{ company.timing.text }}
+## Investment Recommendations
 
-{% if company.timing.bullets %}
-**Market Timing Considerations:**
-{% for bullet in company.timing.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-[Timing analysis not available - common for early-stage startups]
-{% endif %}
+{{ render_section(sections["recommendations"], recommendations_fallback, "Key Decision Points") }}
 
-{% if company.timing.citations %}
-**Sources:** {% for citation in company.timing.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
+---"""
 
-## 15. Moat
-{% if company.moat.has_content() %}
-{{ company.moat.text }}
+# Numbered sections, rendered from memo_sections
+MEMO_BODY_TEMPLATE = """{% from "memo_macros" import render_section %}
+{%- for title, attr, bullet_label, fallback in memo_sections %}
 
-{% if company.moat.bullets %}
-**Potential Defensibility Factors:**
-{% for bullet in company.moat.bullets %}- {{ bullet }}
-{% endfor %}
-{% endif %}
-{% else %}
-[Competitive moat analysis not available - common for early-stage startups]
-{% endif %}
 
-{% if company.moat.citations %}
-**Sources:** {% for citation in company.moat.citations %}{% if citation.source_type == "gpt_knowledge" %}GPT Training Data{% else %}{% if citation.source_type != "pitch_deck" %}[{{ citation.source_type }}]({{ citation.url }}){% else %}[Pitch Deck]({{ citation.url }}){% endif %}{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
-{% endif %}
+## {{ title }}
+{{ render_section(sections[attr], fallback | replace("{company}", company["name"]), bullet_label) }}
+{%- endfor %}
 """
 
+# Per-source citation formatters, with a generic Markdown link for anything else
+_CITATION_FORMATS = {
+    "gpt_knowledge": lambda citation: "GPT Training Data",
+    "pitch_deck": lambda citation: f"[Pitch Deck]({citation.url})"
+}
+
+def _default_citation_format(citation: Citation) -> str:
+    return f"[{citation.source_type}]({citation.url})"
+
+def _format_citations(citations: List[Citation]) -> str:
+    """Render citations as a comma-separated Markdown sources line"""
+    return ", ".join(
+        _CITATION_FORMATS.get(citation.source_type, _default_citation_format)(citation)
+        for citation in citations
+    )
+
+def _create_bytecode_cache():
+    """Create an on-disk cache for compiled template bytecode, shared across process starts"""
+    cache_dir = os.environ.get("MEMO_JINJA_CACHE")
+    try:
+        if cache_dir is None:
+            # Jinja picks a per-user temp directory and refuses one that another user owns
+            # or can write to, since loading its bytecode would run their code
+            return FileSystemBytecodeCache()
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    except (OSError, RuntimeError) as e:
+        logger.warning(f"Jinja bytecode cache disabled: {e}")
+        return None
+    return FileSystemBytecodeCache(directory=cache_dir)
+
+# Numbered memo sections: (heading, StructuredCompanyDoc field, bullet label, fallback text)
+_SECTIONS = [
+    ("1. Executive Summary", "intro", "Key Points",
+     "{company} is a [industry] company that [brief description of what they do]. The company addresses [core problem] through [unique solution], serving [target market]. [Funding status if available]."),
+    ("2. Company Overview", "intro", "Key Milestones",
+     "{company} is a [industry] company focused on [core business area]. The company was founded to [mission/vision]."),
+    ("3. Problem", "problem", "Key Issues",
+     "[Problem description not available - common for early-stage startups]"),
+    ("4. Solution", "solution", "Key Value Propositions",
+     "[Solution details not available - common for early-stage startups]"),
+    ("5. Product", "product", "Key Features",
+     "[Product details not available - common for early-stage startups]"),
+    ("6. Business Model", "business_model", "Revenue Streams",
+     "[Business model details not available - common for early-stage startups]"),
+    ("7. Market Size", "market", "Market Insights",
+     "[Market size data not available - common for early-stage startups]"),
+    ("8. Traction", "traction", "Key Metrics",
+     "[Traction data not available - common for early-stage startups]"),
+    ("9. Growth Strategy", "growth_strategy", "Growth Tactics",
+     "[Growth strategy details not available - common for early-stage startups]"),
+    ("10. Team", "team", "Key Team Members",
+     "[Team information not available - common for early-stage startups]"),
+    ("11. Competition", "competitors", "Key Competitors",
+     "[Competitive analysis not available - common for early-stage startups]"),
+    ("12. Financials", "financials", "Financial Metrics",
+     "[Financial data not available - common for early-stage startups]"),
+    ("13. Risks", "risks", "Potential Risk Factors",
+     "[Risk assessment not available - common for early-stage startups]"),
+    ("14. Timing", "timing", "Market Timing Considerations",
+     "[Timing analysis not available - common for early-stage startups]"),
+    ("15. Moat", "moat", "Potential Defensibility Factors",
+     "[Competitive moat analysis not available - common for early-stage startups]"),
+]
+
+# Compile the memo template once at import; rendering reuses the compiled code.
+# The bytecode cache lets fresh worker processes skip compilation entirely.
+_ENV = Environment(
+    loader=DictLoader({
+        "memo_macros": MEMO_MACROS,
+        "memo_header": MEMO_HEADER_TEMPLATE,
+        "memo_body": MEMO_BODY_TEMPLATE
+    }),
+    bytecode_cache=_create_bytecode_cache(),
+    autoescape=False,
+    finalize=None,
+    undefined=ChainableUndefined,
+    extensions=[],
+    enable_async=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=False,
+    optimized=True,
+    auto_reload=False,
+    cache_size=-1
+)
+_ENV.globals["memo_sections"] = _SECTIONS
+_HEADER_TEMPLATE = _ENV.get_template("memo_header")
+_BODY_TEMPLATE = _ENV.get_template("memo_body")
+
+# Worker threads for generate_memo_async, so rendering stays off the event loop
+_MEMO_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="memo")
+
+# Memo sections, i.e. every StructuredCompanyDoc field except the company name
+_SECTION_FIELDS = [name for name in StructuredCompanyDoc.model_fields if name != "name"]
+
+def _section_context(section: Section) -> Dict:
+    """Flatten a Section into the plain values the template reads"""
+    return {
+        "text": section.text,
+        "bullets_md": "\n".join(f"- {bullet}" for bullet in section.bullets),
+        "citations_md": _format_citations(section.citations),
+        "has_content": section.has_content()
+    }
+
+# (date, formatted string) for the most recent day a memo was dated
+_today_cache = [None, None]
+
+def _today_str() -> str:
+    """Today's memo date, formatted once per calendar day"""
+    today = date.today()
+    if _today_cache[0] != today:
+        _today_cache[:] = [today, today.strftime('%b %d, %Y')]
+    return _today_cache[1]
+
+def _memo_context(company: StructuredCompanyDoc, memo_date: str = None) -> Dict:
+    """Build the template context shared by generate_memo and stream_memo"""
+    if not memo_date:
+        memo_date = _today_str()
+    
+    # Evaluate each section once in Python rather than repeatedly inside the template;
+    # intro is shared by the Executive Summary and Company Overview headings
+    sections = {name: _section_context(getattr(company, name)) for name in _SECTION_FIELDS}
+    # Plain dicts throughout so template lookups are subscripts, not model attribute access
+    return {"company": {"name": company.name}, "sections": sections, "date": memo_date}
+
+# Rendered memos by (date, content hash of the company doc), oldest first; the lock
+# guards it because generate_memo_async renders on _MEMO_POOL threads
+_memo_cache: Dict[tuple, str] = {}
+_memo_cache_lock = threading.Lock()
+MAX_CACHED_MEMOS = 64
+
+def _memo_cache_key(company: StructuredCompanyDoc, memo_date: str) -> tuple:
+    """Key a memo by its date and the doc's content hash, which the doc computes only once"""
+    return memo_date, company.content_hash()
+
 def generate_memo(company: StructuredCompanyDoc, memo_date: str = None) -> str:
     """Generate a conditional memo using Jinja2 template"""
-    if not memo_date:
-        memo_date = date.today().strftime('%b %d, %Y')
+    memo_date = memo_date or _today_str()
+    key = _memo_cache_key(company, memo_date)
+    with _memo_cache_lock:
+        memo = _memo_cache.get(key)
+    if memo is not None:
+        return memo
+    
+    context = _memo_context(company, memo_date)
+    memo = _HEADER_TEMPLATE.render(context) + _BODY_TEMPLATE.render(context)
+    
+    with _memo_cache_lock:
+        if key not in _memo_cache and len(_memo_cache) >= MAX_CACHED_MEMOS:
+            _memo_cache.pop(next(iter(_memo_cache)))
+        _memo_cache[key] = memo
+    return memo
+
+def stream_memo(company: StructuredCompanyDoc, memo_date: str = None) -> Iterator[str]:
+    """Yield the memo in chunks, for writing straight to a file or response"""
+    context = _memo_context(company, memo_date)
+    return chain(_HEADER_TEMPLATE.generate(context), _BODY_TEMPLATE.generate(context))
+
+async def generate_memo_async(company: StructuredCompanyDoc, memo_date: str = None) -> str:
+    """Render the memo on the memo thread pool without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_MEMO_POOL, generate_memo, company, memo_date)
+
+def generate_memos(companies: List[StructuredCompanyDoc], memo_date: str = None,
+                   processes: Optional[int] = None) -> List[str]:
+    """Render memos for many companies in parallel worker processes"""
+    # Fix the date up front so every memo in the batch carries the same one
+    memo_date = memo_date or _today_str()
+    if len(companies) < 2:
+        return [generate_memo(company, memo_date) for company in companies]
     
-    template = Template(MEMO_TEMPLATE)
-    return template.render(company=company, date=memo_date)
\ No newline at end of file
+    # Each worker compiles the templates once when it imports this module
+    with multiprocessing.Pool(processes=processes) as pool:
+        return pool.map(partial(generate_memo, memo_date=memo_date), companies)
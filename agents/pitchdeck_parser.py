@@ -1,42 +1,184 @@
+import asyncio
+import hashlib
 import logging
 import os
 import json
 import re
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from pathlib import Path
-import fitz  # PyMuPDF
-from PIL import Image
-import pytesseract
-import openai
 from datetime import datetime
 
+# Heavy PDF, OCR and OpenAI dependencies are imported where they are used, so importing
+# this module (e.g. for rule-based analysis) stays cheap
+if TYPE_CHECKING:
+    from PIL import Image
+    from openai import AsyncOpenAI
+
+# Pages are OCR'd concurrently, so keep each Tesseract process single-threaded;
+# its own OpenMP threads would otherwise oversubscribe the cores
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 from models.schemas import Section, Citation
 
 logger = logging.getLogger(__name__)
 
-def extract_slide_data(pdf_path: str) -> List[Dict]:
+# Render resolution for OCR (PDF pages are 72 DPI at 1x zoom)
+OCR_DPI = 144
+_ocr_matrix = None
+_OCR_CONFIG = r'--oem 3 --psm 6'  # Use LSTM OCR Engine + Assume uniform block of text
+
+# Extracted text length above which an image-free page is not OCR'd
+MIN_TEXT_FOR_OCR_SKIP = 200
+
+# Slide and OCR text cleanup patterns
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_PAGE_MARKER = re.compile(r'Page \d+ of \d+')
+_RE_SLIDE_MARKER = re.compile(r'Slide \d+')
+_RE_OCR_ARTIFACTS = re.compile(r'[^\w\s\.\,\-\$\%\d]')
+
+# Completion token budget per slide, and gpt-4-turbo's cap on completion tokens per request
+MAX_TOKENS_PER_SLIDE = 1000
+MAX_COMPLETION_TOKENS = 4096
+
+# Slides sent to GPT-4 per analysis request; sized so a full batch's budget fits the cap
+SLIDE_BATCH_SIZE = MAX_COMPLETION_TOKENS // MAX_TOKENS_PER_SLIDE
+
+# Concurrent GPT-4 requests per deck
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "4"))
+
+# On-disk cache of GPT-4 slide analyses, keyed by a hash of the slide text
+SLIDE_CACHE_DIR = os.getenv("SLIDE_CACHE_DIR", os.path.join("cache", "slides"))
+_slide_cache: Dict[str, Dict] = {}
+
+# On-disk cache of extracted slide data, keyed by the PDF's path, mtime and size (or its
+# bytes) and the OCR settings, so re-reading an unchanged deck skips rendering and OCR
+DECK_CACHE_DIR = os.getenv("DECK_CACHE_DIR", os.path.join("cache", "decks"))
+_deck_cache: Dict[str, List[Dict]] = {}
+
+# Deck cache bounds: decks held in memory (oldest dropped first), and on disk the least
+# recently used files beyond the cap, and files unused for the TTL, evicted after each store
+MAX_CACHED_DECKS = 32
+MAX_CACHED_DECK_FILES = 500
+DECK_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+def _deck_cache_key(pdf_path: str, pdf_bytes: Optional[bytes]) -> Optional[str]:
+    """Key a deck by its contents, or by its file's identity; None if the file can't be read"""
+    hasher = hashlib.sha256(f"{OCR_DPI}|{_OCR_CONFIG}|{MIN_TEXT_FOR_OCR_SKIP}|".encode())
+    if pdf_bytes is not None:
+        hasher.update(pdf_bytes)
+    else:
+        try:
+            stat = os.stat(pdf_path)
+        except OSError:
+            return None
+        hasher.update(f"{os.path.abspath(pdf_path)}|{stat.st_mtime_ns}|{stat.st_size}".encode())
+    return hasher.hexdigest()
+
+def _remember_deck(cache_key: str, slides: List[Dict]) -> None:
+    """Hold a deck in memory, dropping the oldest once MAX_CACHED_DECKS are held"""
+    if cache_key not in _deck_cache and len(_deck_cache) >= MAX_CACHED_DECKS:
+        _deck_cache.pop(next(iter(_deck_cache)))
+    _deck_cache[cache_key] = slides
+
+def _load_cached_deck(cache_key: str) -> Optional[List[Dict]]:
+    """Return cached slide data from memory or disk, if present"""
+    if cache_key in _deck_cache:
+        return _deck_cache[cache_key]
+    
+    cache_file = os.path.join(DECK_CACHE_DIR, f"{cache_key}.json")
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r') as f:
+                slides = json.load(f)
+            # Refresh the mtime so eviction treats the entry as recently used
+            os.utime(cache_file, None)
+            _remember_deck(cache_key, slides)
+            return slides
+        except Exception as e:
+            logger.warning(f"Failed to load cached slide data {cache_key}: {e}")
+    return None
+
+def _store_cached_deck(cache_key: str, slides: List[Dict]) -> None:
+    """Cache non-empty slide data in memory and on disk"""
+    if not slides:
+        return
+    
+    _remember_deck(cache_key, slides)
+    try:
+        os.makedirs(DECK_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(DECK_CACHE_DIR, f"{cache_key}.json"), 'w') as f:
+            json.dump(slides, f)
+    except Exception as e:
+        logger.warning(f"Failed to cache slide data {cache_key}: {e}")
+        return
+    _prune_deck_cache()
+
+def _prune_deck_cache() -> None:
+    """Evict deck cache files unused for DECK_CACHE_TTL_SECONDS, then the oldest beyond MAX_CACHED_DECK_FILES"""
+    try:
+        entries = [(entry.stat().st_mtime, entry.path) for entry in os.scandir(DECK_CACHE_DIR)
+                   if entry.name.endswith(".json")]
+    except OSError as e:
+        logger.warning(f"Failed to scan deck cache {DECK_CACHE_DIR}: {e}")
+        return
+    
+    entries.sort()
+    expired_before = time.time() - DECK_CACHE_TTL_SECONDS
+    evict = max(len(entries) - MAX_CACHED_DECK_FILES, 0)
+    while evict < len(entries) and entries[evict][0] < expired_before:
+        evict += 1
+    
+    for _, path in entries[:evict]:
+        try:
+            os.unlink(path)
+        except OSError as e:
+            logger.warning(f"Failed to evict cached deck {path}: {e}")
+    if evict:
+        logger.info(f"Evicted {evict} cached decks")
+
+def extract_slide_data(pdf_path: str, pdf_bytes: Optional[bytes] = None) -> List[Dict]:
     """
     Extract text and image content from each slide of a pitch deck PDF.
     
     Args:
-        pdf_path: Path to the PDF file
+        pdf_path: Path to the PDF file, or just its name when pdf_bytes is given
+        pdf_bytes: PDF contents to read from memory instead of from pdf_path
         
     Returns:
         List of slide data with text and OCR content
     """
+    cache_key = _deck_cache_key(pdf_path, pdf_bytes)
+    cached = _load_cached_deck(cache_key) if cache_key else None
+    if cached is not None:
+        logger.info(f"Using cached slide data for {pdf_path}")
+        # Callers may edit the slide dicts, so never hand out the cached ones
+        return [dict(slide) for slide in cached]
+    
+    slides, complete = _extract_slide_data(pdf_path, pdf_bytes)
+    # A render or OCR failure leaves slides without their image text; the key would keep
+    # serving that partial result for the unchanged file, so only cache complete decks
+    if cache_key and complete:
+        _store_cached_deck(cache_key, [dict(slide) for slide in slides])
+    return slides
+
+def _extract_slide_data(pdf_path: str, pdf_bytes: Optional[bytes]) -> Tuple[List[Dict], bool]:
+    """
+    Render, OCR and combine every slide of a deck; see extract_slide_data.
+    Also returns whether every page that needed OCR was rendered and OCR'd.
+    """
     logger.info(f"Extracting slide data from {pdf_path}")
     
     try:
-        doc = fitz.open(pdf_path)
-        slides = []
+        import fitz  # PyMuPDF
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf") if pdf_bytes is not None else fitz.open(pdf_path)
+        with doc:
+            page_texts, image_contents, ocr_failures = asyncio.run(extract_pages_async(doc))
         
-        for page_num, page in enumerate(doc):
-            logger.info(f"Processing slide {page_num + 1}")
-            
-            # Extract text content using different methods
-            text_content = extract_text_from_page(page)
-            image_content = extract_images_from_page(page)
-            
+        slides = []
+        for page_num, (text_content, image_content) in enumerate(zip(page_texts, image_contents)):
             # Combine all content
             combined_content = combine_slide_content(text_content, image_content, page_num + 1)
             
@@ -48,17 +190,18 @@ def extract_slide_data(pdf_path: str) -> List[Dict]:
                     "image_content": image_content
                 })
         
-        doc.close()
         logger.info(f"Extracted data from {len(slides)} slides")
-        return slides
+        if ocr_failures:
+            logger.warning(f"OCR failed on {ocr_failures} pages of {pdf_path}")
+        return slides, not ocr_failures
         
     except Exception as e:
         logger.error(f"Failed to extract slide data from {pdf_path}: {e}")
-        return []
+        return [], False
 
 def extract_text_from_page(page) -> str:
     """
-    Extract text content from a PDF page using multiple methods.
+    Extract text content from a PDF page from its text blocks.
     
     Args:
         page: PyMuPDF page object
@@ -67,62 +210,205 @@ def extract_text_from_page(page) -> str:
         Extracted text content
     """
     try:
-        # Method 1: Get text blocks (more structured)
+        # Text blocks keep the slide's layout structure. A separate get_text("text")
+        # fallback is not needed: it reads the same text blocks, so it is empty
+        # whenever these are.
         text_blocks = page.get_text("blocks")
-        text_content = []
-        
-        for block in text_blocks:
-            if block[6] == 0:  # Text block
-                text_content.append(block[4])
         
-        # Method 2: Get raw text as fallback
-        raw_text = page.get_text("text").strip()
-        
-        # Combine both methods
-        structured_text = "\n".join(text_content).strip()
-        if structured_text:
-            return structured_text
-        else:
-            return raw_text
+        return "\n".join(block[4] for block in text_blocks if block[6] == 0).strip()
             
     except Exception as e:
         logger.warning(f"Text extraction failed: {e}")
         return ""
 
-def extract_images_from_page(page) -> str:
+def render_page_image(page) -> Optional["Image.Image"]:
     """
-    Extract image content from a PDF page using OCR.
+    Render a PDF page to an image for OCR.
     
     Args:
         page: PyMuPDF page object
         
     Returns:
-        OCR text from images
+        Rendered page image, or None if rendering failed
     """
     try:
-        # Convert page to high-resolution image
-        matrix = fitz.Matrix(2, 2)  # 2x zoom for better OCR
-        pix = page.get_pixmap(matrix=matrix)
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        
-        # Perform OCR with better configuration
-        custom_config = r'--oem 3 --psm 6'  # Use LSTM OCR Engine + Assume uniform block of text
-        ocr_text = pytesseract.image_to_string(img, config=custom_config).strip()
-        
-        # Clean OCR text
-        if ocr_text:
-            # Remove common OCR artifacts
-            ocr_text = re.sub(r'[^\w\s\.\,\-\$\%\d]', ' ', ocr_text)
-            ocr_text = re.sub(r'\s+', ' ', ocr_text).strip()
-            
-            return ocr_text
-        else:
-            return ""
-            
+        # Render straight to grayscale; Tesseract binarizes anyway, so colour is wasted bytes
+        import fitz  # PyMuPDF
+        from PIL import Image
+        
+        global _ocr_matrix
+        if _ocr_matrix is None:
+            _ocr_matrix = fitz.Matrix(OCR_DPI / 72, OCR_DPI / 72)
+        pix = page.get_pixmap(matrix=_ocr_matrix, colorspace=fitz.csGRAY, alpha=False)
+        # Wrap the pixmap's sample memory rather than copying it: samples_mv is a view of it
+        # (pix.samples would already be a copy). The view is only valid while the pixmap
+        # lives, so the image holds a reference to it
+        img = Image.frombuffer("L", (pix.width, pix.height), pix.samples_mv, "raw", "L", pix.stride, 1)
+        img._pixmap = pix
+        return img
+        
+    except Exception as e:
+        logger.warning(f"Page render failed: {e}")
+        return None
+
+_tess_local = threading.local()
+
+def _init_ocr_thread(engines: List) -> None:
+    """Have this OCR pool thread record its tesserocr engine so the pool's owner can End() it"""
+    _tess_local.engines = engines
+
+def _get_tess_api():
+    """Return this thread's tesserocr engine, or None to fall back to pytesseract"""
+    if not hasattr(_tess_local, "api"):
+        try:
+            # Optional: keeps the Tesseract engine loaded in-process instead of spawning
+            # a tesseract binary (and reloading its model) for every page
+            from tesserocr import OEM, PSM, PyTessBaseAPI
+        except ImportError:
+            _tess_local.api = None
+            return None
+        try:
+            # Same settings as _OCR_CONFIG: default (LSTM) engine, single uniform block of text
+            _tess_local.api = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.DEFAULT)
+            engines = getattr(_tess_local, "engines", None)
+            if engines is not None:
+                engines.append(_tess_local.api)
+        except Exception as e:
+            logger.warning(f"tesserocr unavailable, falling back to pytesseract: {e}")
+            _tess_local.api = None
+    return _tess_local.api
+
+def ocr_image(img: Optional["Image.Image"]) -> str:
+    """
+    Extract text from a rendered page image using OCR.
+    
+    Args:
+        img: Rendered page image
+        
+    Returns:
+        OCR text from the image
+    """
+    if img is None:
+        return ""
+    
+    try:
+        return _ocr_text(img)
     except Exception as e:
         logger.warning(f"Image OCR failed: {e}")
         return ""
 
+def _ocr_text(img: "Image.Image") -> str:
+    """OCR and clean a rendered page image; see ocr_image, but OCR errors are raised"""
+    # Perform OCR with better configuration
+    tess_api = _get_tess_api()
+    if tess_api is not None:
+        tess_api.SetImage(img)
+        ocr_text = tess_api.GetUTF8Text().strip()
+    else:
+        import pytesseract
+        ocr_text = pytesseract.image_to_string(img, config=_OCR_CONFIG).strip()
+    
+    # Clean OCR text
+    if ocr_text:
+        # Remove common OCR artifacts
+        ocr_text = _RE_OCR_ARTIFACTS.sub(' ', ocr_text)
+        ocr_text = _RE_WHITESPACE.sub(' ', ocr_text).strip()
+        
+        return ocr_text
+    else:
+        return ""
+
+def prepare_page(page) -> Tuple[str, bool, Optional["Image.Image"]]:
+    """
+    Extract a page's text and, if it needs OCR, render it to an image.
+    
+    Args:
+        page: PyMuPDF page object
+        
+    Returns:
+        Page text, whether the page needs OCR, and rendered image (None when OCR is
+        skipped or rendering failed)
+    """
+    text_content = extract_text_from_page(page)
+    
+    # Born-digital slides with enough text and no raster images gain nothing from OCR
+    if len(text_content) > MIN_TEXT_FOR_OCR_SKIP and not page.get_images(full=False):
+        return text_content, False, None
+    return text_content, True, render_page_image(page)
+
+async def extract_pages_async(doc) -> Tuple[List[str], List[str], int]:
+    """
+    Extract text and OCR content for every page, rendering the next pages while
+    earlier ones are being OCR'd.
+    
+    Args:
+        doc: Open PyMuPDF document
+        
+    Returns:
+        Page texts and OCR texts, in page order, and the number of pages that
+        needed OCR but could not be rendered or OCR'd
+    """
+    # One slot per page in flight, from render until its OCR finishes, so at most
+    # cpu_count rendered images are held at once
+    workers = os.cpu_count() or 1
+    slots = asyncio.Semaphore(workers)
+    loop = asyncio.get_running_loop()
+    
+    # OCR runs on a pool owned by this call; each of its threads keeps one tesserocr
+    # engine, and the engines are released once the pool has shut down
+    engines = []
+    ocr_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr",
+                                  initializer=_init_ocr_thread, initargs=(engines,))
+    
+    failures = 0
+    
+    async def ocr_page(needs_ocr, img):
+        nonlocal failures
+        try:
+            if not needs_ocr:
+                return ""
+            if img is None:
+                failures += 1
+                return ""
+            return await loop.run_in_executor(ocr_pool, _ocr_text, img)
+        except Exception as e:
+            logger.warning(f"Image OCR failed: {e}")
+            failures += 1
+            return ""
+        finally:
+            slots.release()
+    
+    try:
+        page_texts = []
+        ocr_tasks = []
+        for page_num, page in enumerate(doc):
+            logger.info(f"Processing slide {page_num + 1}")
+            await slots.acquire()
+            # Render in a worker thread so in-flight OCR keeps running
+            text_content, needs_ocr, img = await asyncio.to_thread(prepare_page, page)
+            page_texts.append(text_content)
+            ocr_tasks.append(asyncio.create_task(ocr_page(needs_ocr, img)))
+        
+        image_contents = await asyncio.gather(*ocr_tasks)
+        return page_texts, image_contents, failures
+    finally:
+        # Wait for in-flight OCR off the event loop, then free the native engines
+        await asyncio.to_thread(ocr_pool.shutdown, True)
+        for engine in engines:
+            engine.End()
+
+def extract_images_from_page(page) -> str:
+    """
+    Extract image content from a PDF page using OCR.
+    
+    Args:
+        page: PyMuPDF page object
+        
+    Returns:
+        OCR text from images
+    """
+    return ocr_image(render_page_image(page))
+
 def combine_slide_content(text_content: str, image_content: str, slide_number: int) -> str:
     """
     Combine text and image content into a structured format for GPT analysis.
@@ -171,11 +457,11 @@ def clean_slide_text(text: str) -> str:
         Cleaned text content
     """
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _RE_WHITESPACE.sub(' ', text)
     
     # Remove common slide artifacts
-    text = re.sub(r'Page \d+ of \d+', '', text)
-    text = re.sub(r'Slide \d+', '', text)
+    text = _RE_PAGE_MARKER.sub('', text)
+    text = _RE_SLIDE_MARKER.sub('', text)
     
     # Remove very short lines (likely artifacts)
     lines = text.split('\n')
@@ -183,27 +469,11 @@ def clean_slide_text(text: str) -> str:
     
     return '\n'.join(cleaned_lines).strip()
 
-def create_slide_analysis_prompt(slide_number: int, slide_text: str) -> str:
-    """
-    Create a GPT-4 prompt for analyzing a single slide with structured content.
-    
-    Args:
-        slide_number: Slide number
-        slide_text: Structured content from the slide (text + image OCR)
-        
-    Returns:
-        Formatted prompt for GPT-4
-    """
-    return f"""
-You are a venture capital analyst reviewing a startup pitch deck.
+# Slide analysis instructions. These are kept static and sent first so that repeated
+# requests share a cacheable prompt prefix; slide content goes in the user message.
+_SLIDE_ANALYSIS_INSTRUCTIONS = """You are a professional VC analyst reviewing a startup pitch deck. Extract only factual information from pitch deck slides. Be concise and accurate.
 
-Here is the structured content from slide {slide_number}:
-
---- SLIDE CONTENT START ---
-{slide_text}
---- SLIDE CONTENT END ---
-
-Analyze this slide and extract any relevant information about the startup's:
+Each slide is given between "--- SLIDE <n> CONTENT ---" and "--- END ---" markers. Analyze it and extract any relevant information about the startup's:
 
 1. **Problem** - What problem is the startup solving?
 2. **Solution** - How does the startup solve this problem?
@@ -226,32 +496,90 @@ Pay special attention to:
 
 If the slide contains relevant information for any of these sections, extract it into structured format.
 If no relevant information is found, return an empty result.
+Only include sections that have actual content. For empty sections, omit them entirely.
+Focus on extracting specific, actionable information rather than generic statements.
+Cite each section as "Pitch Deck Slide <n>" using the slide's number.
+"""
+
+_SECTIONS_JSON_FORMAT = """{
+  "problem": {"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide <n>"]},
+  "solution": {"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide <n>"]},
+  "product": {"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide <n>"]},
+  "business_model": {"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide <n>"]},
+  "traction": {"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide <n>"]},
+  "funding": {"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide <n>"]},
+  "team": {"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide <n>"]},
+  "market": {"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide <n>"]},
+  "competition": {"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide <n>"]},
+  "financials": {"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide <n>"]},
+  "growth_strategy": {"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide <n>"]},
+  "vision": {"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide <n>"]}
+}"""
 
+SLIDE_ANALYSIS_SYSTEM_PROMPT = f"""{_SLIDE_ANALYSIS_INSTRUCTIONS}
 Return ONLY valid JSON in this exact format:
-{{
-  "problem": {{"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide {slide_number}"]}},
-  "solution": {{"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide {slide_number}"]}},
-  "product": {{"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide {slide_number}"]}},
-  "business_model": {{"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide {slide_number}"]}},
-  "traction": {{"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide {slide_number}"]}},
-  "funding": {{"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide {slide_number}"]}},
-  "team": {{"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide {slide_number}"]}},
-  "market": {{"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide {slide_number}"]}},
-  "competition": {{"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide {slide_number}"]}},
-  "financials": {{"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide {slide_number}"]}},
-  "growth_strategy": {{"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide {slide_number}"]}},
-  "vision": {{"text": "description", "bullets": ["point1", "point2"], "citations": ["Pitch Deck Slide {slide_number}"]}}
-}}
+{_SECTIONS_JSON_FORMAT}
+"""
 
-Only include sections that have actual content. For empty sections, omit them entirely.
-Focus on extracting specific, actionable information rather than generic statements.
+BATCH_ANALYSIS_SYSTEM_PROMPT = f"""{_SLIDE_ANALYSIS_INSTRUCTIONS}
+You will be given several slides. Return ONLY valid JSON keyed by slide number, in this exact format:
+{{"slides": {{"<n>": <sections for slide n>}}}}
+
+where the sections for each slide follow this format (use an empty object for slides with no relevant information):
+{_SECTIONS_JSON_FORMAT}
 """
 
-def analyze_slide_with_gpt(slide_number: int, slide_text: str) -> Dict:
+def _slide_cache_key(slide_text: str) -> str:
+    return hashlib.sha256(slide_text.encode()).hexdigest()
+
+def _load_cached_slide(cache_key: str) -> Optional[Dict]:
+    """Return a cached slide analysis from memory or disk, if present"""
+    if cache_key in _slide_cache:
+        return _slide_cache[cache_key]
+    
+    cache_file = os.path.join(SLIDE_CACHE_DIR, f"{cache_key}.json")
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r') as f:
+                result = json.load(f)
+            _slide_cache[cache_key] = result
+            return result
+        except Exception as e:
+            logger.warning(f"Failed to load cached slide analysis {cache_key}: {e}")
+    return None
+
+def _store_cached_slide(cache_key: str, result: Dict) -> None:
+    """Cache a non-empty slide analysis in memory and on disk"""
+    if not result:
+        return
+    
+    _slide_cache[cache_key] = result
+    try:
+        os.makedirs(SLIDE_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(SLIDE_CACHE_DIR, f"{cache_key}.json"), 'w') as f:
+            json.dump(result, f)
+    except Exception as e:
+        logger.warning(f"Failed to cache slide analysis {cache_key}: {e}")
+
+def create_slide_analysis_prompt(slide_number: int, slide_text: str) -> str:
     """
-    Analyze a single slide using GPT-4.
+    Create the per-slide GPT-4 message; the instructions live in SLIDE_ANALYSIS_SYSTEM_PROMPT.
     
     Args:
+        slide_number: Slide number
+        slide_text: Structured content from the slide (text + image OCR)
+        
+    Returns:
+        Formatted prompt for GPT-4
+    """
+    return f"--- SLIDE {slide_number} CONTENT ---\n{slide_text}\n--- END ---"
+
+async def analyze_slide_with_gpt_async(client: "AsyncOpenAI", slide_number: int, slide_text: str) -> Dict:
+    """
+    Analyze a single slide using GPT-4 without blocking the event loop.
+    
+    Args:
+        client: Async OpenAI client
         slide_number: Slide number
         slide_text: Text content from the slide
         
@@ -259,19 +587,20 @@ def analyze_slide_with_gpt(slide_number: int, slide_text: str) -> Dict:
         Dictionary of extracted sections
     """
     try:
-        # Check if OpenAI API key is available
-        if not os.getenv("OPENAI_API_KEY"):
-            logger.warning("OPENAI_API_KEY not found. Cannot perform GPT-4 analysis.")
-            return {}
+        cache_key = _slide_cache_key(slide_text)
+        cached = _load_cached_slide(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached analysis for slide {slide_number}")
+            return cached
         
         prompt = create_slide_analysis_prompt(slide_number, slide_text)
         
-        response = openai.ChatCompletion.create(
+        response = await client.chat.completions.create(
             model="gpt-4-turbo",
             messages=[
                 {
                     "role": "system",
-                    "content": "You are a professional VC analyst. Extract only factual information from pitch deck slides. Be concise and accurate."
+                    "content": SLIDE_ANALYSIS_SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
@@ -279,29 +608,19 @@ def analyze_slide_with_gpt(slide_number: int, slide_text: str) -> Dict:
                 }
             ],
             temperature=0.3,
-            max_tokens=1000
+            max_tokens=MAX_TOKENS_PER_SLIDE,
+            response_format={"type": "json_object"}
         )
         
-        content = response.choices[0].message.content.strip()
-        
         # Parse JSON response
         try:
-            if content.startswith('{') and content.endswith('}'):
-                result = json.loads(content)
-            else:
-                # Try to find JSON within the response
-                start_idx = content.find('{')
-                end_idx = content.rfind('}') + 1
-                if start_idx != -1 and end_idx > start_idx:
-                    json_str = content[start_idx:end_idx]
-                    result = json.loads(json_str)
-                else:
-                    raise ValueError("No valid JSON found in response")
+            result = json.loads(response.choices[0].message.content)
             
             logger.info(f"Successfully analyzed slide {slide_number}")
+            _store_cached_slide(cache_key, result)
             return result
             
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, TypeError) as e:
             logger.warning(f"Failed to parse GPT-4 response for slide {slide_number}: {e}")
             return {}
             
@@ -309,9 +628,9 @@ def analyze_slide_with_gpt(slide_number: int, slide_text: str) -> Dict:
         logger.warning(f"GPT-4 analysis failed for slide {slide_number}: {e}")
         return {}
 
-def analyze_slide_with_rules(slide_number: int, slide_text: str) -> Dict:
+def analyze_slide_with_gpt(slide_number: int, slide_text: str) -> Dict:
     """
-    Analyze a single slide using rule-based extraction when GPT-4 is not available.
+    Analyze a single slide using GPT-4.
     
     Args:
         slide_number: Slide number
@@ -320,206 +639,228 @@ def analyze_slide_with_rules(slide_number: int, slide_text: str) -> Dict:
     Returns:
         Dictionary of extracted sections
     """
-    logger.info(f"Using rule-based analysis for slide {slide_number}")
+    # Check if OpenAI API key is available
+    if not os.getenv("OPENAI_API_KEY"):
+        logger.warning("OPENAI_API_KEY not found. Cannot perform GPT-4 analysis.")
+        return {}
     
-    result = {}
-    text_lower = slide_text.lower()
-    
-    # Problem section detection
-    problem_keywords = ['problem', 'challenge', 'issue', 'pain point', 'struggle', 'difficulty', 'frustration']
-    if any(keyword in text_lower for keyword in problem_keywords):
-        # Extract sentences containing problem keywords
-        sentences = slide_text.split('.')
-        problem_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in problem_keywords):
-                problem_sentences.append(sentence.strip())
-        
-        if problem_sentences:
-            result['problem'] = {
-                'text': '. '.join(problem_sentences[:2]),  # Limit to 2 sentences
-                'bullets': [s.strip() for s in problem_sentences[:3]],
-                'citations': [f"slide_{slide_number}"]
-            }
+    from openai import AsyncOpenAI
     
-    # Solution section detection
-    solution_keywords = ['solution', 'solve', 'address', 'enable', 'provide', 'offer', 'platform', 'product']
-    if any(keyword in text_lower for keyword in solution_keywords):
-        sentences = slide_text.split('.')
-        solution_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in solution_keywords):
-                solution_sentences.append(sentence.strip())
-        
-        if solution_sentences:
-            result['solution'] = {
-                'text': '. '.join(solution_sentences[:2]),
-                'bullets': [s.strip() for s in solution_sentences[:3]],
-                'citations': [f"slide_{slide_number}"]
-            }
+    async def run():
+        async with AsyncOpenAI(max_retries=3, timeout=60.0) as client:
+            return await analyze_slide_with_gpt_async(client, slide_number, slide_text)
     
-    # Team section detection
-    team_keywords = ['team', 'founder', 'ceo', 'cto', 'coo', 'founders', 'leadership']
-    if any(keyword in text_lower for keyword in team_keywords):
-        sentences = slide_text.split('.')
-        team_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in team_keywords):
-                team_sentences.append(sentence.strip())
-        
-        if team_sentences:
-            result['team'] = {
-                'text': '. '.join(team_sentences[:2]),
-                'bullets': [s.strip() for s in team_sentences[:3]],
-                'citations': [f"slide_{slide_number}"]
-            }
+    return asyncio.run(run())
+
+def create_batch_analysis_prompt(slides_batch: List[Dict]) -> str:
+    """
+    Create the GPT-4 message for a batch of slides; the instructions live in BATCH_ANALYSIS_SYSTEM_PROMPT.
     
-    # Market section detection
-    market_keywords = ['market', 'tam', 'sam', 'som', 'opportunity', 'size', 'billion', 'million']
-    if any(keyword in text_lower for keyword in market_keywords):
-        sentences = slide_text.split('.')
-        market_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in market_keywords):
-                market_sentences.append(sentence.strip())
-        
-        if market_sentences:
-            result['market'] = {
-                'text': '. '.join(market_sentences[:2]),
-                'bullets': [s.strip() for s in market_sentences[:3]],
-                'citations': [f"slide_{slide_number}"]
-            }
+    Args:
+        slides_batch: Slide data dicts with slide_number and text
+        
+    Returns:
+        Formatted prompt for GPT-4
+    """
+    return "\n\n".join(
+        create_slide_analysis_prompt(slide['slide_number'], slide['text']) for slide in slides_batch
+    )
+
+async def analyze_slides_batch_with_gpt(client: "AsyncOpenAI", slides_batch: List[Dict]) -> Dict[int, Dict]:
+    """
+    Analyze a batch of slides with a single GPT-4 request.
     
-    # Traction section detection
-    traction_keywords = ['users', 'customers', 'growth', 'revenue', 'funding', 'raised', 'million', 'billion', 'users']
-    if any(keyword in text_lower for keyword in traction_keywords):
-        sentences = slide_text.split('.')
-        traction_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in traction_keywords):
-                traction_sentences.append(sentence.strip())
-        
-        if traction_sentences:
-            result['traction'] = {
-                'text': '. '.join(traction_sentences[:2]),
-                'bullets': [s.strip() for s in traction_sentences[:3]],
-                'citations': [f"slide_{slide_number}"]
-            }
+    Args:
+        client: Async OpenAI client
+        slides_batch: Slide data dicts with slide_number and text
+        
+    Returns:
+        Dictionary of extracted sections per slide number
+    """
+    slide_numbers = [slide['slide_number'] for slide in slides_batch]
+    try:
+        response = await client.chat.completions.create(
+            model="gpt-4-turbo",
+            messages=[
+                {
+                    "role": "system",
+                    "content": BATCH_ANALYSIS_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": create_batch_analysis_prompt(slides_batch)
+                }
+            ],
+            temperature=0.3,
+            max_tokens=min(MAX_COMPLETION_TOKENS, MAX_TOKENS_PER_SLIDE * len(slides_batch)),
+            response_format={"type": "json_object"}
+        )
+        
+        slide_results = json.loads(response.choices[0].message.content).get("slides", {})
+        logger.info(f"Successfully analyzed slides {slide_numbers}")
+        
+        # Skip malformed entries one at a time so they don't discard the rest of the batch
+        results = {}
+        for number, result in slide_results.items():
+            try:
+                slide_number = int(number)
+            except (TypeError, ValueError):
+                logger.warning(f"Ignoring GPT-4 result with invalid slide number {number!r}")
+                continue
+            if isinstance(result, dict):
+                results[slide_number] = result
+        return results
+        
+    except Exception as e:
+        logger.warning(f"GPT-4 batch analysis failed for slides {slide_numbers}: {e}")
+        return {}
+
+def analyze_slides_with_gpt(slides: List[Dict]) -> Dict[int, Dict]:
+    """
+    Analyze slides with GPT-4 in concurrent batches of SLIDE_BATCH_SIZE.
     
-    # Product section detection
-    product_keywords = ['product', 'feature', 'platform', 'app', 'software', 'tool', 'service']
-    if any(keyword in text_lower for keyword in product_keywords):
-        sentences = slide_text.split('.')
-        product_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in product_keywords):
-                product_sentences.append(sentence.strip())
-        
-        if product_sentences:
-            result['product'] = {
-                'text': '. '.join(product_sentences[:2]),
-                'bullets': [s.strip() for s in product_sentences[:3]],
-                'citations': [f"slide_{slide_number}"]
-            }
+    Args:
+        slides: Slide data dicts with slide_number and text
+        
+    Returns:
+        Dictionary of extracted sections per slide number
+    """
+    if not os.getenv("OPENAI_API_KEY"):
+        logger.warning("OPENAI_API_KEY not found. Cannot perform GPT-4 analysis.")
+        return {}
     
-    # Business model section detection
-    business_keywords = ['business model', 'revenue', 'pricing', 'monetization', 'saas', 'subscription', 'freemium']
-    if any(keyword in text_lower for keyword in business_keywords):
-        sentences = slide_text.split('.')
-        business_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in business_keywords):
-                business_sentences.append(sentence.strip())
-        
-        if business_sentences:
-            result['business_model'] = {
-                'text': '. '.join(business_sentences[:2]),
-                'bullets': [s.strip() for s in business_sentences[:3]],
-                'citations': [f"slide_{slide_number}"]
-            }
+    # Serve repeated slides from the cache and only send the rest to GPT-4
+    results = {}
+    cache_keys = {}
+    uncached = []
+    for slide in slides:
+        cache_key = _slide_cache_key(slide['text'])
+        cached = _load_cached_slide(cache_key)
+        if cached is not None:
+            results[slide['slide_number']] = cached
+        else:
+            cache_keys[slide['slide_number']] = cache_key
+            uncached.append(slide)
     
-    # Growth strategy section detection
-    growth_keywords = ['growth', 'strategy', 'go-to-market', 'acquisition', 'partnership', 'expansion', 'scale']
-    if any(keyword in text_lower for keyword in growth_keywords):
-        sentences = slide_text.split('.')
-        growth_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in growth_keywords):
-                growth_sentences.append(sentence.strip())
-        
-        if growth_sentences:
-            result['growth_strategy'] = {
-                'text': '. '.join(growth_sentences[:2]),
-                'bullets': [s.strip() for s in growth_sentences[:3]],
-                'citations': [f"slide_{slide_number}"]
-            }
+    if results:
+        logger.info(f"Using cached analysis for {len(results)} slides")
+    if not uncached:
+        return results
     
-    # Financials section detection
-    financial_keywords = ['financial', 'revenue', 'funding', 'investment', 'series', 'valuation', 'burn rate', 'runway']
-    if any(keyword in text_lower for keyword in financial_keywords):
-        sentences = slide_text.split('.')
-        financial_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in financial_keywords):
-                financial_sentences.append(sentence.strip())
-        
-        if financial_sentences:
-            result['financials'] = {
-                'text': '. '.join(financial_sentences[:2]),
-                'bullets': [s.strip() for s in financial_sentences[:3]],
-                'citations': [f"slide_{slide_number}"]
-            }
+    batches = [uncached[i:i + SLIDE_BATCH_SIZE] for i in range(0, len(uncached), SLIDE_BATCH_SIZE)]
     
-    # Risks section detection
-    risk_keywords = ['risk', 'challenge', 'threat', 'competition', 'regulatory', 'execution']
-    if any(keyword in text_lower for keyword in risk_keywords):
-        sentences = slide_text.split('.')
-        risk_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in risk_keywords):
-                risk_sentences.append(sentence.strip())
-        
-        if risk_sentences:
-            result['risks'] = {
-                'text': '. '.join(risk_sentences[:2]),
-                'bullets': [s.strip() for s in risk_sentences[:3]],
-                'citations': [f"slide_{slide_number}"]
-            }
+    # Bound in-flight requests to stay under the account's rate limit; the client
+    # itself retries 429s with exponential backoff
+    sem = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
     
-    # Timing/Why Now section detection
-    timing_keywords = ['timing', 'now', 'trend', 'market timing', 'opportunity', 'momentum', 'wave']
-    if any(keyword in text_lower for keyword in timing_keywords):
-        sentences = slide_text.split('.')
-        timing_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in timing_keywords):
-                timing_sentences.append(sentence.strip())
-        
-        if timing_sentences:
-            result['timing'] = {
-                'text': '. '.join(timing_sentences[:2]),
-                'bullets': [s.strip() for s in timing_sentences[:3]],
-                'citations': [f"slide_{slide_number}"]
-            }
+    async def run_batch(client, batch):
+        async with sem:
+            return await analyze_slides_batch_with_gpt(client, batch)
     
-    # Moat/Defensibility section detection
-    moat_keywords = ['moat', 'defensibility', 'competitive advantage', 'barrier', 'network effect', 'proprietary', 'ip']
-    if any(keyword in text_lower for keyword in moat_keywords):
-        sentences = slide_text.split('.')
-        moat_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in moat_keywords):
-                moat_sentences.append(sentence.strip())
-        
-        if moat_sentences:
-            result['moat'] = {
-                'text': '. '.join(moat_sentences[:2]),
-                'bullets': [s.strip() for s in moat_sentences[:3]],
+    from openai import AsyncOpenAI
+    
+    async def run_batches():
+        async with AsyncOpenAI(max_retries=3, timeout=120.0) as client:
+            return await asyncio.gather(*(run_batch(client, batch) for batch in batches))
+    
+    for batch_result in asyncio.run(run_batches()):
+        for slide_number, result in batch_result.items():
+            if slide_number in cache_keys:
+                results[slide_number] = result
+                _store_cached_slide(cache_keys[slide_number], result)
+    return results
+
+# Keywords that flag a sentence as belonging to each section in rule-based analysis
+RULE_SECTION_KEYWORDS = {
+    'problem': ['problem', 'challenge', 'issue', 'pain point', 'struggle', 'difficulty', 'frustration'],
+    'solution': ['solution', 'solve', 'address', 'enable', 'provide', 'offer', 'platform', 'product'],
+    'team': ['team', 'founder', 'ceo', 'cto', 'coo', 'founders', 'leadership'],
+    'market': ['market', 'tam', 'sam', 'som', 'opportunity', 'size', 'billion', 'million'],
+    'traction': ['users', 'customers', 'growth', 'revenue', 'funding', 'raised', 'million', 'billion'],
+    'product': ['product', 'feature', 'platform', 'app', 'software', 'tool', 'service'],
+    'business_model': ['business model', 'revenue', 'pricing', 'monetization', 'saas', 'subscription', 'freemium'],
+    'growth_strategy': ['growth', 'strategy', 'go-to-market', 'acquisition', 'partnership', 'expansion', 'scale'],
+    'financials': ['financial', 'revenue', 'funding', 'investment', 'series', 'valuation', 'burn rate', 'runway'],
+    'risks': ['risk', 'challenge', 'threat', 'competition', 'regulatory', 'execution'],
+    'timing': ['timing', 'now', 'trend', 'market timing', 'opportunity', 'momentum', 'wave'],
+    'moat': ['moat', 'defensibility', 'competitive advantage', 'barrier', 'network effect', 'proprietary', 'ip']
+}
+
+# Keyword -> sections it flags, plus one lookahead alternation that reports a keyword at
+# every position, or a '.' sentence break. Shortest keywords come first; each longer keyword
+# with a prefix keyword ("market timing") still contains another keyword flagging its own
+# sections ("timing").
+_RULE_KEYWORD_SECTIONS: Dict[str, List[str]] = {}
+for _section_name, _keywords in RULE_SECTION_KEYWORDS.items():
+    for _keyword in _keywords:
+        _RULE_KEYWORD_SECTIONS.setdefault(_keyword, []).append(_section_name)
+_MIN_RULE_KEYWORD_LENGTH = min(len(keyword) for keyword in _RULE_KEYWORD_SECTIONS)
+_RULE_KEYWORD_REGEX = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_RULE_KEYWORD_SECTIONS, key=len)) + "))|\\."
+)
+
+def analyze_slide_with_rules(slide_number: int, slide_text: str) -> Dict:
+    """
+    Analyze a single slide using rule-based extraction when GPT-4 is not available.
+    
+    Args:
+        slide_number: Slide number
+        slide_text: Text content from the slide
+        
+    Returns:
+        Dictionary of extracted sections
+    """
+    logger.info(f"Using rule-based analysis for slide {slide_number}")
+    
+    # Too short to contain any keyword
+    if len(slide_text) < _MIN_RULE_KEYWORD_LENGTH:
+        return {}
+    
+    # One scan over the whole slide finds both keywords and the '.' sentence breaks;
+    # keywords never contain '.', so each match falls inside a single sentence
+    sentence_index = 0
+    sentence_sections: Dict[int, set] = {}
+    for match in _RULE_KEYWORD_REGEX.finditer(slide_text.lower()):
+        keyword = match.group(1)
+        if keyword is None:
+            sentence_index += 1
+        else:
+            sentence_sections.setdefault(sentence_index, set()).update(_RULE_KEYWORD_SECTIONS[keyword])
+    
+    if not sentence_sections:
+        return {}
+    
+    # Collect matching sentences per section
+    sentences = slide_text.split('.')
+    section_sentences = {section_name: [] for section_name in RULE_SECTION_KEYWORDS}
+    for sentence_index, matched_sections in sentence_sections.items():
+        for section_name in matched_sections:
+            section_sentences[section_name].append(sentences[sentence_index].strip())
+    
+    result = {}
+    for section_name, sentences in section_sentences.items():
+        if sentences:
+            result[section_name] = {
+                'text': '. '.join(sentences[:2]),  # Limit to 2 sentences
+                'bullets': [s.strip() for s in sentences[:3]],
                 'citations': [f"slide_{slide_number}"]
             }
     
     return result
 
+def analyze_slides_with_rules(slides: List[Dict]) -> List[Dict]:
+    """
+    Run rule-based analysis over slides.
+    
+    Args:
+        slides: Slide data dicts with slide_number and text
+        
+    Returns:
+        Rule-based results, in slide order
+    """
+    # A few regex scans per slide; in-process is faster than any worker pool's startup and pickling
+    return [analyze_slide_with_rules(slide['slide_number'], slide['text']) for slide in slides]
+
 def merge_slide_results(all_slide_results: List[Dict]) -> Dict[str, Section]:
     """
     Merge results from all slides into a final structured format.
@@ -543,7 +884,7 @@ def merge_slide_results(all_slide_results: List[Dict]) -> Dict[str, Section]:
     
     for section_name in section_names:
         section_texts = []
-        section_bullets = []
+        section_bullets = {}  # Insertion-ordered, deduplicated as bullets are collected
         section_citations = []
         
         # Collect all data for this section from all slides
@@ -554,8 +895,8 @@ def merge_slide_results(all_slide_results: List[Dict]) -> Dict[str, Section]:
                 if section_data.get('text'):
                     section_texts.append(section_data['text'])
                 
-                if section_data.get('bullets'):
-                    section_bullets.extend(section_data['bullets'])
+                for bullet in section_data.get('bullets') or []:
+                    section_bullets.setdefault(bullet, None)
                 
                 if section_data.get('citations'):
                     section_citations.extend(section_data['citations'])
@@ -565,8 +906,7 @@ def merge_slide_results(all_slide_results: List[Dict]) -> Dict[str, Section]:
             # Merge text content
             merged_text = ' '.join(section_texts) if section_texts else ""
             
-            # Remove duplicate bullets
-            unique_bullets = list(dict.fromkeys(section_bullets))
+            unique_bullets = list(section_bullets)
             
             # Create citations
             citations = []
@@ -587,12 +927,13 @@ def merge_slide_results(all_slide_results: List[Dict]) -> Dict[str, Section]:
     logger.info(f"Merged {len(merged_sections)} sections from pitch deck")
     return merged_sections
 
-def parse_pitch_deck(pdf_path: str) -> Dict[str, Section]:
+def parse_pitch_deck(pdf_path: str, pdf_bytes: Optional[bytes] = None) -> Dict[str, Section]:
     """
     Extracts structured investment memo data from a pitch deck PDF with both text and image content.
 
     Args:
-        pdf_path (str): Path to the uploaded pitch deck.
+        pdf_path (str): Path to the uploaded pitch deck, or just its file name when pdf_bytes is given.
+        pdf_bytes (bytes, optional): Contents of an in-memory upload, parsed without touching disk.
     
     Returns:
         Dict[str, Section]: Mapping of memo section names to Section objects (text, bullets, citations).
@@ -600,12 +941,12 @@ def parse_pitch_deck(pdf_path: str) -> Dict[str, Section]:
     logger.info(f"Starting pitch deck analysis for {pdf_path}")
     
     # Validate file exists
-    if not os.path.exists(pdf_path):
+    if pdf_bytes is None and not os.path.exists(pdf_path):
         logger.error(f"PDF file not found: {pdf_path}")
         return {}
     
     # Step 1: Extract slide data (text + OCR)
-    slides = extract_slide_data(pdf_path)
+    slides = extract_slide_data(pdf_path, pdf_bytes)
     
     if not slides:
         logger.warning("No slides could be extracted from the PDF")
@@ -638,21 +979,19 @@ def parse_pitch_deck(pdf_path: str) -> Dict[str, Section]:
     # Step 3: Fallback to rule-based analysis
     all_slide_results = []
     
+    # Try GPT-4 first, a batch of slides per request
+    gpt_results = analyze_slides_with_gpt(slides)
+    
+    # If GPT-4 failed, try rule-based analysis
+    rule_slides = [slide for slide in slides if not gpt_results.get(slide['slide_number'])]
+    rule_results = dict(zip(
+        [slide['slide_number'] for slide in rule_slides],
+        analyze_slides_with_rules(rule_slides)
+    ))
+    
     for slide in slides:
         logger.info(f"Analyzing slide {slide['slide_number']}")
-        
-        # Try GPT-4 first, fallback to rule-based if not available
-        slide_result = analyze_slide_with_gpt(
-            slide['slide_number'],
-            slide['text']
-        )
-        
-        # If GPT-4 failed, try rule-based analysis
-        if not slide_result:
-            slide_result = analyze_slide_with_rules(
-                slide['slide_number'],
-                slide['text']
-            )
+        slide_result = gpt_results.get(slide['slide_number']) or rule_results.get(slide['slide_number'])
         
         if slide_result:
             all_slide_results.append(slide_result)
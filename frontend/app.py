@@ -1,5 +1,6 @@
 import streamlit as st
 import sys
+import logging
 import os
 import json
 import re
@@ -25,6 +26,10 @@ from agents.memo_generator import generate_memo
 from agents.pitchdeck_parser import parse_pitch_deck, get_pitch_deck_summary
 from models.schemas import StructuredCompanyDoc
 from utils.pdf_generator import generate_pdf_bytes
+from utils.run_context import start_memo_run
+from pydantic import ValidationError
+
+logger = logging.getLogger(__name__)
 
 # Configure page
 st.set_page_config(
@@ -43,20 +48,22 @@ if 'current_memo' not in st.session_state:
 if 'current_doc' not in st.session_state:
     st.session_state.current_doc = None
 
-def extract_company_name(query: str) -> str:
-    """Extract company name from user query"""
-    # Common patterns for company analysis
-    patterns = [
+# Common patterns for company analysis, compiled once at import
+_COMPANY_PATTERNS = [
+    re.compile(p) for p in (
         r"analyze\s+(\w+)",
         r"what's\s+(\w+)'s",
         r"(\w+)'s\s+(business model|traction|team|competitors|funding)",
         r"tell me about\s+(\w+)",
         r"research\s+(\w+)"
-    ]
-    
+    )
+]
+
+def extract_company_name(query: str) -> str:
+    """Extract company name from user query"""
     query_lower = query.lower()
-    for pattern in patterns:
-        match = re.search(pattern, query_lower)
+    for pattern in _COMPANY_PATTERNS:
+        match = pattern.search(query_lower)
         if match:
             return match.group(1).title()
     
@@ -68,12 +75,26 @@ def extract_company_name(query: str) -> str:
     
     return None
 
+# Memo section fields on StructuredCompanyDoc
+_SECTION_NAMES = frozenset(StructuredCompanyDoc.model_fields) - {"name"}
+
+# Query keywords and the section field each one refers to
+_QUESTION_SECTIONS = {
+    keyword: keyword.replace(' ', '_')
+    for keyword in ('problem', 'solution', 'team', 'market', 'traction', 'competitors', 'business model', 'financials')
+}
+
+# One alternation over every keyword, longest first, so a query is scanned once
+_QUESTION_SECTION_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(_QUESTION_SECTIONS, key=len, reverse=True))
+)
+
 def get_section_content(doc: StructuredCompanyDoc, section_name: str) -> str:
     """Get content from a specific section of the memo"""
-    if not hasattr(doc, section_name):
+    if section_name not in _SECTION_NAMES:
         return f"Section '{section_name}' not found."
     
-    section = getattr(doc, section_name)
+    section = doc.__dict__[section_name]
     if not section.has_content():
         return f"No data available for {section_name}."
     
@@ -98,35 +119,62 @@ def get_section_content(doc: StructuredCompanyDoc, section_name: str) -> str:
     
     return "\n".join(content)
 
+@st.cache_resource
+def get_analyzer() -> EnhancedAnalyzer:
+    """Shared EnhancedAnalyzer, created once rather than on every script rerun"""
+    return EnhancedAnalyzer()
+
+class NoSectionsError(ValueError):
+    """The analyzer found nothing to report for the requested company"""
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def analyze_company(company_name: str) -> StructuredCompanyDoc:
+    """Build the company document from GPT knowledge, cached per company so reruns don't repeat the analysis"""
+    # One memo run: every citation created for this analysis shares its timestamp
+    start_memo_run()
+    analyzer = get_analyzer()
+    memo_sections = analyzer._generate_memo_from_gpt_knowledge(company_name)
+    
+    # Raise rather than return None so failures aren't cached
+    if not memo_sections:
+        raise NoSectionsError("EnhancedAnalyzer returned no sections")
+    
+    # Convert sections to StructuredCompanyDoc
+    return analyzer._create_comprehensive_memo_from_research(memo_sections, company_name)
+
 def run_full_analysis(company_name: str) -> StructuredCompanyDoc:
     """Run the full analysis pipeline for a company using EnhancedAnalyzer with GPT knowledge"""
     try:
-        st.info(f"🔍 Creating EnhancedAnalyzer for {company_name}...")
-        analyzer = EnhancedAnalyzer()
-        
         st.info(f"🔍 Getting GPT knowledge for {company_name}...")
-        memo_sections = analyzer._generate_memo_from_gpt_knowledge(company_name)
-        
-        if not memo_sections:
-            st.error("❌ EnhancedAnalyzer returned no sections")
-            return None
-            
-        # Convert sections to StructuredCompanyDoc
-        doc = analyzer._create_comprehensive_memo_from_research(memo_sections, company_name)
+        doc = analyze_company(company_name)
         
         st.info(f"✅ Analysis complete! Generated comprehensive document with GPT knowledge")
         return doc
         
+    except NoSectionsError as e:
+        st.error(f"❌ {str(e)}")
+        return None
+    except ValidationError as e:
+        # The analyzer built a document that doesn't match the schema: a bug, not bad input
+        logger.exception(f"Invalid company document for {company_name}")
+        st.error(f"❌ Internal error building the company document: {e}")
+        return None
     except Exception as e:
         st.error(f"❌ Error in run_full_analysis: {str(e)}")
         import traceback
         st.code(traceback.format_exc())
         return None
 
+@st.cache_data(show_spinner=False, ttl=3600)
 def generate_markdown(doc: StructuredCompanyDoc) -> str:
     """Generate markdown from the company document"""
     return generate_memo(doc)
 
+@st.cache_data(show_spinner=False, ttl=3600)
+def generate_memo_pdf(memo_md: str) -> bytes:
+    """Render the memo PDF, cached on the memo text so repeat downloads don't regenerate it"""
+    return generate_pdf_bytes(memo_md)
+
 def handle_company_analysis(company_name: str):
     """Handle company analysis and update session state"""
     try:
@@ -173,13 +221,9 @@ def handle_question(query: str, company_name: str):
     doc = st.session_state.current_doc
     
     # Extract section name from query
-    query_lower = query.lower()
-    sections = ['problem', 'solution', 'team', 'market', 'traction', 'competitors', 'business model', 'financials']
-    
-    for section in sections:
-        if section in query_lower:
-            content = get_section_content(doc, section.replace(' ', '_'))
-            return content
+    match = _QUESTION_SECTION_PATTERN.search(query.lower())
+    if match:
+        return get_section_content(doc, _QUESTION_SECTIONS[match.group()])
     
     # If no specific section found, return general info
     return f"Here's what I know about {company_name}:\n\n{st.session_state.current_memo[:500]}..."
@@ -188,13 +232,8 @@ def process_pitch_deck(uploaded_file):
     """Process uploaded pitch deck"""
     try:
         with st.spinner("Analyzing pitch deck..."):
-            # Save uploaded file temporarily
-            temp_path = f"temp_pitch_deck.pdf"
-            with open(temp_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
-            # Parse pitch deck
-            sections = parse_pitch_deck(temp_path)
+            # Parse pitch deck straight from the upload's bytes
+            sections = parse_pitch_deck(uploaded_file.name, pdf_bytes=uploaded_file.getvalue())
             
             if sections:
                 # Create company document
@@ -328,7 +367,7 @@ def main():
         with col2:
             if st.button("📥 Download PDF", use_container_width=True):
                 if st.session_state.current_memo:
-                    pdf_bytes = generate_pdf_bytes(st.session_state.current_memo)
+                    pdf_bytes = generate_memo_pdf(st.session_state.current_memo)
                     st.download_button(
                         label="Download Investment Memo",
                         data=pdf_bytes,
@@ -0,0 +1,45 @@
+import os
+import json
+import hashlib
+import logging
+from typing import Any
+from openai import OpenAI
+from openai.types.chat import ChatCompletion
+
+logger = logging.getLogger(__name__)
+
+# On-disk cache of chat completions, keyed by a hash of the full request.
+# Off by default so live API checks still hit the API; set LLM_CACHE=1 to enable it.
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", os.path.join("cache", "llm"))
+
+def llm_cache_enabled() -> bool:
+    return os.getenv("LLM_CACHE", "").lower() in ("1", "true", "yes")
+
+def _response_cache_path(params: dict) -> str:
+    request_hash = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    return os.path.join(LLM_CACHE_DIR, f"{request_hash}.json")
+
+def cached_chat_completion(client: OpenAI, **params: Any) -> ChatCompletion:
+    """
+    Call client.chat.completions.create, serving identical requests from the on-disk
+    cache when LLM_CACHE is enabled. Only use it for deterministic, replayable prompts.
+    """
+    if not llm_cache_enabled():
+        return client.chat.completions.create(**params)
+    
+    cache_path = _response_cache_path(params)
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r') as f:
+                return ChatCompletion.model_validate_json(f.read())
+        except Exception as e:
+            logger.warning(f"Failed to load cached completion {cache_path}: {e}")
+    
+    response = client.chat.completions.create(**params)
+    try:
+        os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'w') as f:
+            f.write(response.model_dump_json())
+    except Exception as e:
+        logger.warning(f"Failed to cache completion {cache_path}: {e}")
+    return response
@@ -1,11 +1,19 @@
 import os
+import io
 import json
+import hashlib
 import logging
+import asyncio
+import threading
 import time
-from typing import List, Dict, Optional
+import concurrent.futures
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
-from openai import OpenAI
-from models.schemas import RawDoc, Section, Citation
+from collections import defaultdict
+from functools import lru_cache
+from openai import APIError, AsyncOpenAI, RateLimitError
+from pydantic import TypeAdapter, ValidationError
+from models.schemas import RawDoc, Section, Citation, BatchExtractionResult
 
 logger = logging.getLogger(__name__)
 
@@ -14,41 +22,107 @@ api_key = os.getenv("OPENAI_API_KEY")
 if not api_key:
     logger.warning("OPENAI_API_KEY not found in environment variables")
 
-def chunk_text(text: str, max_chunk_size: int = 4000) -> List[str]:
+# Concurrent GPT-4 extraction requests per run
+MAX_CONCURRENT_EXTRACTIONS = 8
+
+EXTRACTION_MODEL = "gpt-4o-mini"
+
+# Input tokens per extraction request, well within the model's context after the prompt
+# and the 2000-token output budget
+MAX_CHUNK_TOKENS = 12000
+
+# Chunks packed into one extraction request, so the instructions are sent once per batch.
+# Six full chunks stay within gpt-4o-mini's context and 16K output limit.
+EXTRACTION_BATCH_SIZE = 6
+
+# Output token budget per chunk in a batch
+MAX_TOKENS_PER_CHUNK = 2000
+
+# Streamed characters allowed before the JSON object must have started
+MAX_PREAMBLE_CHARS = 200
+
+# Chunk cache bounds: least recently used entries beyond the cap, and entries unused for the TTL,
+# are evicted after each run that adds to the cache
+MAX_CACHED_CHUNKS = 2000
+CHUNK_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Background event loop that owns the shared AsyncOpenAI client; an async client's connection
+# pool is bound to one loop, so every extraction runs on this loop instead of a fresh asyncio.run()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+def _submit(coro) -> concurrent.futures.Future:
+    """Schedule a coroutine on the extractor's background event loop, starting the loop if needed"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="section-extractor", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _loop)
+
+def _run(coro):
+    """Run a coroutine on the extractor's background event loop and wait for its result"""
+    return _submit(coro).result()
+
+# Validates a merged section's citations in one call into pydantic's core
+_CITATIONS_ADAPTER = TypeAdapter(List[Citation])
+
+@lru_cache(maxsize=1)
+def _get_async_client() -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client so its HTTP connection pool is reused across calls"""
+    return AsyncOpenAI(api_key=api_key)
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Tokenizer for the extraction model, or None if it cannot be loaded"""
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model(EXTRACTION_MODEL)
+    except Exception as e:
+        # tiktoken fetches its encoding files on first use, which fails offline
+        logger.warning(f"tiktoken unavailable, estimating tokens from characters: {e}")
+        return None
+
+def count_tokens(text: str) -> int:
+    """Count tokens as the extraction model sees them (about 4 characters per token if tiktoken is unavailable)"""
+    encoding = _get_encoding()
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+def chunk_text(text: str, max_chunk_tokens: int = MAX_CHUNK_TOKENS) -> List[str]:
     """Split text into chunks that fit within token limits"""
-    if len(text) <= max_chunk_size:
+    paragraphs = text.split('\n\n')
+    paragraph_tokens = [count_tokens(paragraph) for paragraph in paragraphs]
+    # Each paragraph separator is about one token
+    if sum(paragraph_tokens) + len(paragraphs) - 1 <= max_chunk_tokens:
         return [text]
     
     chunks = []
-    paragraphs = text.split('\n\n')
-    current_chunk = ""
+    # Collect paragraphs and join once per chunk; repeated += recopies the chunk each time
+    current_parts = []
+    current_tokens = 0
     
-    for paragraph in paragraphs:
-        if len(current_chunk) + len(paragraph) < max_chunk_size:
-            current_chunk += paragraph + '\n\n'
+    for paragraph, tokens in zip(paragraphs, paragraph_tokens):
+        if current_tokens + tokens < max_chunk_tokens:
+            current_parts.append(paragraph)
+            current_tokens += tokens + 1
         else:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = paragraph + '\n\n'
+            if current_parts:
+                chunks.append('\n\n'.join(current_parts).strip())
+            current_parts = [paragraph]
+            current_tokens = tokens + 1
     
-    if current_chunk:
-        chunks.append(current_chunk.strip())
+    if current_parts:
+        chunks.append('\n\n'.join(current_parts).strip())
     
     return chunks
 
-def create_extraction_prompt(company_name: str, chunk: Dict) -> str:
-    """Create the prompt for GPT-4 section extraction"""
-    return f"""Company: {company_name}
-Source URL: {chunk['url']}
-Source Title: {chunk['title']}
+EXTRACTION_SYSTEM_PROMPT = """You are a professional VC analyst. Only extract insights that are directly found in the source text.
 
-TEXT:
-\"\"\"{chunk['text']}\"\"\"
+You will be given numbered chunks of source text about a company. For each chunk, extract ONLY information that is directly found in that chunk's text. Do not make assumptions or add external knowledge.
 
-Instructions:
-You are a professional VC analyst. Extract ONLY information that is directly found in the source text above. Do not make assumptions or add external knowledge.
-
-For each of the following sections, return ONLY if relevant information is found in the source text:
+For each of the following sections, return ONLY if relevant information is found in the chunk:
 
 1. introduction - Company overview, what they do, mission
 2. problem - Pain points they solve, market problems
@@ -63,33 +137,46 @@ For each of the following sections, return ONLY if relevant information is found
 11. financials - Revenue, costs, projections
 12. why_now - Market timing, trends, catalysts
 
-Format output as JSON:
-{{
-  "section_name": {{
-    "text": "Brief summary of relevant information",
-    "bullets": ["Key point 1", "Key point 2"],
-    "citation": "{chunk['url']}"
-  }}
-}}
+For each section found, give a brief summary of the relevant information as text, the key points as bullets,
+and the chunk's source URL as the citation.
 
-If no relevant information is found for a section, omit it entirely.
-Return only valid JSON with no additional text.
-"""
+If no relevant information is found for a section, set it to null.
 
-def extract_from_chunk(company_name: str, chunk: Dict, max_retries: int = 3) -> Dict:
-    """Extract sections from a single chunk using GPT-4"""
+Return one entry per chunk, with its chunk number."""
+
+def create_extraction_prompt(company_name: str, chunks: List[Dict]) -> str:
+    """Create the GPT-4 message for a batch of chunks; the instructions live in EXTRACTION_SYSTEM_PROMPT"""
+    blocks = [f"Company: {company_name}"]
+    for i, chunk in enumerate(chunks):
+        blocks.append(f"""=== CHUNK {i} (url: {chunk['url']}) ===
+Source Title: {chunk['title']}
+
+TEXT:
+\"\"\"{chunk['text']}\"\"\"""")
+    return "\n\n".join(blocks)
+
+async def extract_from_chunks_async(client: AsyncOpenAI, company_name: str, chunks: List[Dict], max_retries: int = 3) -> List[Dict]:
+    """
+    Extract sections from a batch of chunks with one GPT-4o mini structured-output request.
+    Returns one result per chunk, in order; chunks with nothing extracted get an empty dict.
+    """
+    urls = [chunk['url'] for chunk in chunks]
     try:
-        prompt = create_extraction_prompt(company_name, chunk)
+        prompt = create_extraction_prompt(company_name, chunks)
         
         for attempt in range(max_retries):
             try:
-                client = OpenAI(api_key=api_key)
-                response = client.chat.completions.create(
-                    model="gpt-4-turbo",
+                # Stream the response so a refusal or non-JSON preamble aborts early
+                buffer = io.StringIO()
+                json_started = False
+                aborted = False
+                parsed = None
+                async with client.chat.completions.stream(
+                    model=EXTRACTION_MODEL,
                     messages=[
                         {
                             "role": "system", 
-                            "content": "You are a professional VC analyst. Only extract insights that are directly found in the source text. Return only valid JSON with no additional text."
+                            "content": EXTRACTION_SYSTEM_PROMPT
                         },
                         {
                             "role": "user", 
@@ -97,121 +184,253 @@ def extract_from_chunk(company_name: str, chunk: Dict, max_retries: int = 3) ->
                         }
                     ],
                     temperature=0.3,
-                    max_tokens=2000
-                )
+                    max_tokens=MAX_TOKENS_PER_CHUNK * len(chunks),
+                    response_format=BatchExtractionResult
+                ) as stream:
+                    async for event in stream:
+                        if event.type == "refusal.delta":
+                            aborted = True
+                            break
+                        if event.type != "content.delta":
+                            continue
+                        
+                        buffer.write(event.delta)
+                        if json_started:
+                            continue
+                        
+                        # Until the object opens the buffer is at most a short preamble, so
+                        # reading it back stays cheap; afterwards deltas are only appended
+                        content = buffer.getvalue().lstrip()
+                        if content.startswith("{"):
+                            json_started = True
+                        elif len(content) > MAX_PREAMBLE_CHARS:
+                            logger.warning(f"Aborting malformed extraction stream for {urls}")
+                            aborted = True
+                            break
                 
-                # Parse the response
-                content = response.choices[0].message.content.strip()
+                if not aborted:
+                    try:
+                        parsed = BatchExtractionResult.model_validate_json(buffer.getvalue())
+                    except ValidationError:
+                        pass
                 
-                # Try to extract JSON from the response
-                if content.startswith('{') and content.endswith('}'):
-                    result = json.loads(content)
-                    logger.info(f"Successfully extracted sections from {chunk['url']}")
-                    return result
-                else:
-                    # Try to find JSON within the response
-                    start_idx = content.find('{')
-                    end_idx = content.rfind('}') + 1
-                    if start_idx != -1 and end_idx > start_idx:
-                        json_str = content[start_idx:end_idx]
-                        result = json.loads(json_str)
-                        logger.info(f"Successfully extracted sections from {chunk['url']}")
-                        return result
-                    else:
-                        logger.warning(f"No valid JSON found in response from {chunk['url']}")
-                        return {}
-                        
-            except json.JSONDecodeError as e:
-                logger.warning(f"JSON decode error on attempt {attempt + 1} for {chunk['url']}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    logger.error(f"Failed to parse JSON after {max_retries} attempts for {chunk['url']}")
-                    return {}
+                # parsed is None on a refusal or malformed output
+                if parsed is None:
+                    logger.warning(f"No extraction returned for {urls}")
+                    return [{} for _ in chunks]
+                
+                results = [{} for _ in chunks]
+                for entry in parsed.chunks:
+                    if 0 <= entry.chunk < len(chunks):
+                        results[entry.chunk] = entry.sections.model_dump(exclude_none=True)
+                
+                logger.info(f"Successfully extracted sections from {urls}")
+                return results
                     
-            except Exception as e:
-                logger.warning(f"API error on attempt {attempt + 1} for {chunk['url']}: {e}")
+            except (RateLimitError, APIError) as e:
+                logger.warning(f"API error on attempt {attempt + 1} for {urls}: {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
                 else:
-                    logger.error(f"Failed to extract from {chunk['url']} after {max_retries} attempts")
-                    return {}
+                    logger.error(f"Failed to extract from {urls} after {max_retries} attempts")
+                    return [{} for _ in chunks]
                     
     except Exception as e:
-        logger.error(f"Unexpected error processing {chunk['url']}: {e}")
-        return {}
+        logger.error(f"Unexpected error processing {urls}: {e}")
+        return [{} for _ in chunks]
 
-def merge_section_results(all_results: List[Dict]) -> Dict[str, Section]:
-    """Merge multiple chunk results into final Section objects"""
-    merged_sections = {}
+async def extract_from_chunk_async(client: AsyncOpenAI, company_name: str, chunk: Dict, max_retries: int = 3) -> Dict:
+    """Extract sections from a single chunk using GPT-4o mini structured outputs"""
+    return (await extract_from_chunks_async(client, company_name, [chunk], max_retries))[0]
+
+def extract_from_chunk(company_name: str, chunk: Dict, max_retries: int = 3) -> Dict:
+    """Extract sections from a single chunk using GPT-4o mini structured outputs"""
+    async def run():
+        return await extract_from_chunk_async(_get_async_client(), company_name, chunk, max_retries)
     
-    for result in all_results:
-        for section_name, section_data in result.items():
-            if section_name not in merged_sections:
-                merged_sections[section_name] = {
-                    'text': [],
-                    'bullets': [],
-                    'citations': []
-                }
-            
-            # Add text if present
-            if 'text' in section_data and section_data['text']:
-                merged_sections[section_name]['text'].append(section_data['text'])
-            
-            # Add bullets if present
-            if 'bullets' in section_data and section_data['bullets']:
-                merged_sections[section_name]['bullets'].extend(section_data['bullets'])
-            
-            # Add citation if present
-            if 'citation' in section_data and section_data['citation']:
-                merged_sections[section_name]['citations'].append(section_data['citation'])
+    return _run(run())
+
+def _chunk_cache_path(cache_dir: str, company_name: str, chunk: Dict) -> str:
+    """Content-addressed cache file for a chunk's extraction result"""
+    chunk_hash = hashlib.sha256((company_name + chunk['url'] + chunk['text']).encode()).hexdigest()
+    return os.path.join(cache_dir, "chunks", chunk_hash[:2], f"{chunk_hash}.json")
+
+def _load_cached_chunk(cache_path: str) -> Optional[Dict]:
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, 'r') as f:
+            result = json.load(f)
+        # Refresh the mtime so eviction treats the entry as recently used
+        os.utime(cache_path, None)
+        return result
+    except Exception as e:
+        logger.warning(f"Failed to load cached chunk {cache_path}: {e}")
+        return None
+
+def _store_cached_chunk(cache_path: str, result: Dict) -> None:
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump(result, f)
+    except Exception as e:
+        logger.warning(f"Failed to cache chunk {cache_path}: {e}")
+
+def _prune_chunk_cache(cache_dir: str) -> None:
+    """Evict chunk cache entries unused for CHUNK_CACHE_TTL_SECONDS, then the oldest beyond MAX_CACHED_CHUNKS"""
+    entries = []
+    try:
+        for shard in os.scandir(os.path.join(cache_dir, "chunks")):
+            if shard.is_dir():
+                entries.extend((entry.stat().st_mtime, entry.path) for entry in os.scandir(shard.path))
+    except OSError as e:
+        logger.warning(f"Failed to scan chunk cache {cache_dir}: {e}")
+        return
     
-    # Convert to Section objects
-    final_sections = {}
-    for section_name, data in merged_sections.items():
-        # Combine text with newlines
-        combined_text = '\n\n'.join(data['text']) if data['text'] else None
+    entries.sort()
+    expired_before = time.time() - CHUNK_CACHE_TTL_SECONDS
+    evict = max(len(entries) - MAX_CACHED_CHUNKS, 0)
+    while evict < len(entries) and entries[evict][0] < expired_before:
+        evict += 1
+    
+    for _, path in entries[:evict]:
+        try:
+            os.unlink(path)
+        except OSError as e:
+            logger.warning(f"Failed to evict cached chunk {path}: {e}")
+    if evict:
+        logger.info(f"Evicted {evict} cached chunk extractions")
+
+async def iter_chunk_results(company_name: str, chunks: List[Dict], cache_dir: Optional[str] = None) -> AsyncIterator[Tuple[int, Union[Dict, Exception]]]:
+    """
+    Extract sections from all chunks in batches of EXTRACTION_BATCH_SIZE, running at most
+    MAX_CONCURRENT_EXTRACTIONS requests at a time, and yield (chunk index, result) as each
+    batch completes. A result is the exception its batch raised if the batch failed.
+    With a cache_dir, each chunk's result is cached by content hash so only new chunks hit the API.
+    Uses the shared client, so it must run on the extractor's loop via _run().
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+    cache_paths = [_chunk_cache_path(cache_dir, company_name, chunk) if cache_dir else None for chunk in chunks]
+    
+    cached_results = []
+    uncached = []
+    for i, chunk in enumerate(chunks):
+        cached = _load_cached_chunk(cache_paths[i]) if cache_paths[i] else None
+        if cached is not None:
+            logger.info(f"Using cached extraction for chunk {i+1}/{len(chunks)} from {chunk['url']}")
+            cached_results.append((i, cached))
+        else:
+            uncached.append(i)
+    
+    batches = [uncached[i:i + EXTRACTION_BATCH_SIZE] for i in range(0, len(uncached), EXTRACTION_BATCH_SIZE)]
+    
+    client = _get_async_client()
+    
+    async def bounded(batch):
+        try:
+            async with sem:
+                logger.info(f"Processing chunks {[i + 1 for i in batch]} of {len(chunks)}")
+                batch_results = await extract_from_chunks_async(client, company_name, [chunks[i] for i in batch])
+        except Exception as e:
+            return batch, [e] * len(batch)
         
-        # Remove duplicate bullets
-        unique_bullets = list(dict.fromkeys(data['bullets'])) if data['bullets'] else []
+        # Empty results also signal failures, so only cache actual extractions
+        for i, result in zip(batch, batch_results):
+            if cache_paths[i] and result:
+                _store_cached_chunk(cache_paths[i], result)
+        return batch, batch_results
+    
+    # Start the requests before handing out cached results
+    tasks = [asyncio.ensure_future(bounded(batch)) for batch in batches]
+    try:
+        for i, cached in cached_results:
+            yield i, cached
+        
+        for next_batch in asyncio.as_completed(tasks):
+            batch, batch_results = await next_batch
+            for i, result in zip(batch, batch_results):
+                yield i, result
+    finally:
+        # Stop outstanding requests if the consumer stopped early
+        for task in tasks:
+            task.cancel()
+    
+    if cache_dir and batches:
+        _prune_chunk_cache(cache_dir)
+
+async def extract_chunks_async(company_name: str, chunks: List[Dict], cache_dir: Optional[str] = None) -> List[Dict]:
+    """
+    Extract sections from all chunks; see iter_chunk_results.
+    Returns one result per chunk, in chunk order, or the exception its batch raised.
+    """
+    results = [None] * len(chunks)
+    async for i, result in iter_chunk_results(company_name, chunks, cache_dir):
+        results[i] = result
+    return results
+
+def _new_merged_sections() -> Dict[str, Dict[str, List[str]]]:
+    return defaultdict(lambda: {'text': [], 'bullets': [], 'citations': []})
+
+def _merge_chunk_result(merged_sections: Dict[str, Dict[str, List[str]]], result: Dict, urls: Optional[List[str]] = None) -> None:
+    """Add one chunk's sections to merged_sections in place"""
+    for section_name, section_data in result.items():
+        merged = merged_sections[section_name]
         
-        # Create citations
-        citations = []
-        for url in data['citations']:
-            citations.append(Citation(
-                url=url,
-                snippet=f"Extracted from {section_name} section",
-                source_type="website",
-                timestamp=datetime.now()
-            ))
+        # Add text if present
+        if section_data.get('text'):
+            merged['text'].append(section_data['text'])
         
+        # Add bullets if present
+        if section_data.get('bullets'):
+            merged['bullets'].extend(section_data['bullets'])
+        
+        # Add citation if present
+        if section_data.get('citation'):
+            if urls:
+                merged['citations'].extend(urls)
+            else:
+                merged['citations'].append(section_data['citation'])
+
+def _build_sections(merged_sections: Dict[str, Dict[str, List[str]]]) -> Dict[str, Section]:
+    """Convert merged section data to Section objects"""
+    timestamp = datetime.now()
+    final_sections = {}
+    for section_name, data in merged_sections.items():
+        snippet = f"Extracted from {section_name} section"
         final_sections[section_name] = Section(
-            text=combined_text,
-            bullets=unique_bullets,
-            citations=citations
+            # Combine text with newlines
+            text='\n\n'.join(data['text']) or None,
+            # Remove duplicate bullets
+            bullets=list(dict.fromkeys(data['bullets'])),
+            citations=_CITATIONS_ADAPTER.validate_python([
+                {'url': url, 'snippet': snippet, 'source_type': "website", 'timestamp': timestamp}
+                for url in data['citations']
+            ])
         )
     
     return final_sections
 
-def extract_sections_with_gpt(company_name: str, raw_docs: List[RawDoc]) -> Dict[str, Section]:
+def merge_section_results(all_results: List[Dict], source_urls: Optional[List[List[str]]] = None) -> Dict[str, Section]:
     """
-    Extract structured memo sections from raw documents using GPT-4.
-    
-    Args:
-        company_name: Name of the company being analyzed
-        raw_docs: List of RawDoc objects from various sources
-        
-    Returns:
-        Dictionary mapping section names to Section objects
+    Merge multiple chunk results into final Section objects.
+    source_urls, if given, lists every URL each result's text appeared at; a cited section
+    is then attributed to all of them.
     """
-    if not api_key:
-        logger.error("OPENAI_API_KEY not found. Cannot perform GPT-4 extraction.")
-        return {}
+    merged_sections = _new_merged_sections()
+    for i, result in enumerate(all_results):
+        _merge_chunk_result(merged_sections, result, source_urls[i] if source_urls else None)
     
-    logger.info(f"Starting GPT-4 extraction for {company_name} with {len(raw_docs)} documents")
-    
-    # Prepare chunks from raw documents
+    return _build_sections(merged_sections)
+
+def _prepare_chunks(raw_docs: List[RawDoc]) -> Tuple[List[Dict], List[List[str]]]:
+    """
+    Split raw documents into unique chunks. Pages often share identical boilerplate, so each
+    distinct chunk text is extracted once and attributed to every URL it appeared at.
+    Returns the chunks and, for each, the URLs it appeared at.
+    """
     chunks = []
+    chunk_urls = []
+    seen = {}
     for doc in raw_docs:
         if not doc.text or len(doc.text.strip()) < 50:
             continue  # Skip very short documents
@@ -220,30 +439,39 @@ def extract_sections_with_gpt(company_name: str, raw_docs: List[RawDoc]) -> Dict
         text_chunks = chunk_text(doc.text)
         
         for i, text_chunk in enumerate(text_chunks):
+            url = str(doc.url)
+            h = hashlib.sha1(text_chunk.encode()).digest()
+            if h in seen:
+                urls = chunk_urls[seen[h]]
+                if url not in urls:
+                    urls.append(url)
+                continue
+            
+            seen[h] = len(chunks)
             chunk = {
                 "text": text_chunk,
-                "url": str(doc.url),
+                "url": url,
                 "title": doc.title or "Unknown"
             }
             chunks.append(chunk)
+            chunk_urls.append([url])
     
-    logger.info(f"Created {len(chunks)} chunks for processing")
-    
-    # Process chunks with rate limiting
+    logger.info(f"Created {len(chunks)} unique chunks for processing")
+    return chunks, chunk_urls
+
+def _collect_sections(chunks: List[Dict], chunk_urls: List[List[str]], results: List[Dict]) -> Dict[str, Section]:
+    """Merge per-chunk extraction results into sections, logging the chunks that failed"""
     all_results = []
-    for i, chunk in enumerate(chunks):
-        logger.info(f"Processing chunk {i+1}/{len(chunks)} from {chunk['url']}")
-        
-        result = extract_from_chunk(company_name, chunk)
-        if result:
+    result_urls = []
+    for chunk, urls, result in zip(chunks, chunk_urls, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to extract from {chunk['url']}: {result}")
+        elif result:
             all_results.append(result)
-        
-        # Rate limiting - wait between requests
-        if i < len(chunks) - 1:  # Don't wait after the last chunk
-            time.sleep(1)  # 1 second between requests
+            result_urls.append(urls)
     
     # Merge results into final sections
-    final_sections = merge_section_results(all_results)
+    final_sections = merge_section_results(all_results, result_urls)
     
     # Log summary
     populated_sections = [name for name, section in final_sections.items() if section.has_content()]
@@ -251,63 +479,86 @@ def extract_sections_with_gpt(company_name: str, raw_docs: List[RawDoc]) -> Dict
     
     return final_sections
 
-def extract_sections_with_gpt_cached(company_name: str, raw_docs: List[RawDoc], cache_dir: str = "cache") -> Dict[str, Section]:
+def extract_sections_with_gpt(company_name: str, raw_docs: List[RawDoc], cache_dir: Optional[str] = None) -> Dict[str, Section]:
     """
-    Cached version of extract_sections_with_gpt to avoid re-processing same documents.
+    Extract structured memo sections from raw documents using GPT-4.
+    
+    Args:
+        company_name: Name of the company being analyzed
+        raw_docs: List of RawDoc objects from various sources
+        cache_dir: Optional directory for per-chunk extraction caching
+        
+    Returns:
+        Dictionary mapping section names to Section objects
+    """
+    if not api_key:
+        logger.error("OPENAI_API_KEY not found. Cannot perform GPT-4 extraction.")
+        return {}
+    
+    logger.info(f"Starting GPT-4 extraction for {company_name} with {len(raw_docs)} documents")
+    
+    chunks, chunk_urls = _prepare_chunks(raw_docs)
+    
+    # Process chunks in concurrent batches; the semaphore in iter_chunk_results does the rate limiting
+    results = _run(extract_chunks_async(company_name, chunks, cache_dir))
+    return _collect_sections(chunks, chunk_urls, results)
+
+async def aextract_sections_with_gpt(company_name: str, raw_docs: List[RawDoc], cache_dir: Optional[str] = None) -> Dict[str, Section]:
+    """
+    Async version of extract_sections_with_gpt, for callers already running an event loop.
+    The requests still run on the extractor's loop, which owns the shared client; the
+    caller's loop awaits the result without blocking.
     """
-    import hashlib
+    if not api_key:
+        logger.error("OPENAI_API_KEY not found. Cannot perform GPT-4 extraction.")
+        return {}
     
-    # Create cache directory if it doesn't exist
-    os.makedirs(cache_dir, exist_ok=True)
+    logger.info(f"Starting GPT-4 extraction for {company_name} with {len(raw_docs)} documents")
     
-    # Create cache key based on company name and document URLs
-    cache_key = f"{company_name}_{hashlib.md5(str([doc.url for doc in raw_docs]).encode()).hexdigest()}"
-    cache_file = os.path.join(cache_dir, f"{cache_key}.json")
+    chunks, chunk_urls = _prepare_chunks(raw_docs)
+    results = await asyncio.wrap_future(_submit(extract_chunks_async(company_name, chunks, cache_dir)))
+    return _collect_sections(chunks, chunk_urls, results)
+
+def extract_sections_stream(company_name: str, raw_docs: List[RawDoc], cache_dir: Optional[str] = None) -> Iterator[Dict[str, Section]]:
+    """
+    Like extract_sections_with_gpt, but yields the sections merged so far each time a chunk's
+    result arrives, so callers can render partial results before the slowest request returns.
+    Sections are merged in arrival order; use extract_sections_with_gpt for chunk order.
+    """
+    if not api_key:
+        logger.error("OPENAI_API_KEY not found. Cannot perform GPT-4 extraction.")
+        return
     
-    # Check if cached result exists
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'r') as f:
-                cached_data = json.load(f)
-            
-            # Convert back to Section objects
-            sections = {}
-            for section_name, section_data in cached_data.items():
-                citations = []
-                for citation_data in section_data.get('citations', []):
-                    citations.append(Citation(**citation_data))
-                
-                sections[section_name] = Section(
-                    text=section_data.get('text'),
-                    bullets=section_data.get('bullets', []),
-                    citations=citations
-                )
-            
-            logger.info(f"Loaded cached extraction results for {company_name}")
-            return sections
-            
-        except Exception as e:
-            logger.warning(f"Failed to load cache for {company_name}: {e}")
+    logger.info(f"Streaming GPT-4 extraction for {company_name} with {len(raw_docs)} documents")
     
-    # Perform extraction
-    sections = extract_sections_with_gpt(company_name, raw_docs)
+    chunks, chunk_urls = _prepare_chunks(raw_docs)
+    merged_sections = _new_merged_sections()
     
-    # Cache the results
-    try:
-        cache_data = {}
-        for section_name, section in sections.items():
-            cache_data[section_name] = {
-                'text': section.text,
-                'bullets': section.bullets,
-                'citations': [citation.model_dump() for citation in section.citations]
-            }
-        
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f, indent=2)
-        
-        logger.info(f"Cached extraction results for {company_name}")
-        
-    except Exception as e:
-        logger.warning(f"Failed to cache results for {company_name}: {e}")
+    # Each step of the async iterator runs on the extractor's loop
+    results = iter_chunk_results(company_name, chunks, cache_dir)
     
-    return sections 
\ No newline at end of file
+    async def next_result():
+        return await results.__anext__()
+    
+    try:
+        while True:
+            try:
+                i, result = _run(next_result())
+            except StopAsyncIteration:
+                break
+            
+            if isinstance(result, Exception):
+                logger.error(f"Failed to extract from {chunks[i]['url']}: {result}")
+            elif result:
+                _merge_chunk_result(merged_sections, result, chunk_urls[i])
+                yield _build_sections(merged_sections)
+    finally:
+        _run(results.aclose())
+
+def extract_sections_with_gpt_cached(company_name: str, raw_docs: List[RawDoc], cache_dir: str = "cache") -> Dict[str, Section]:
+    """
+    Cached version of extract_sections_with_gpt to avoid re-processing same documents.
+    Results are cached per chunk by content, so re-runs over overlapping documents only
+    extract the chunks that are new or changed.
+    """
+    return extract_sections_with_gpt(company_name, raw_docs, cache_dir=cache_dir)
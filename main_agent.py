@@ -1,12 +1,8 @@
-import json
+import asyncio
 import os
 import logging
-from agents.company_researcher import CompanyResearcher
-from agents.market_mapper import map_market
-from agents.founder_profiler import evaluate_founder
-from agents.memo_generator import generate_memo
-from models.schemas import StructuredCompanyDoc
-from utils.pdf_generator import generate_pdf
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -14,20 +10,39 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def render_charts(company_name: str, company_doc) -> dict:
+    """Render a memo's charts; runs in a worker process, so matplotlib is only imported there"""
+    from utils.chart_generator import generate_charts_for_memo
+    return generate_charts_for_memo(company_name, company_doc)
+
 def run_main_agent():
-    # Load input data
-    with open('data/test_input.json', 'r') as f:
-        data = json.load(f)
+    # Agents pull in openai, matplotlib and reportlab, so import them only when the agent runs
+    from agents.company_researcher import analyze_company_with_team_and_market
+    from agents.memo_generator import generate_memo
+    from utils.pdf_generator import generate_pdf
+    from models.schemas import AgentInput
+    from utils.paths import safe_filename
+    from utils.run_context import start_memo_run
+    
+    # Load and validate input data in one pass
+    with open('data/test_input.json', 'rb') as f:
+        data = AgentInput.model_validate_json(f.read())
 
-    # Initialize company researcher
-    researcher = CompanyResearcher()
+    # One memo run: every citation the agents create below shares its timestamp
+    start_memo_run()
+    
+    # Analyze company with evidence-based extraction (includes founder name), with the
+    # team and market agents running concurrently to fill any sections it leaves empty
+    company_doc = asyncio.run(analyze_company_with_team_and_market(
+        data.company, 
+        data.website, 
+        data.founder  # Pass founder name if available
+    ))
     
-    # Analyze company with evidence-based extraction (includes founder name)
-    company_doc = researcher.analyze_company(
-        data['company'], 
-        data['website'], 
-        data.get('founder')  # Pass founder name if available
-    )
+    # Render charts in a separate process; importing matplotlib and rendering are CPU-bound
+    # and would otherwise hold up the memo and JSON writes below
+    chart_pool = ProcessPoolExecutor(max_workers=1)
+    charts_future = chart_pool.submit(render_charts, data.company, company_doc)
     
     # Generate memo with conditional sections
     memo = generate_memo(company_doc)
@@ -35,23 +50,25 @@ def run_main_agent():
     # Print memo
     print(memo)
 
-    # Save memo as text
+    # Save memo as text; UTF-8 with '\n' line endings on every platform
     os.makedirs('data/memos', exist_ok=True)
-    memo_path = os.path.join('data/memos', f"{data['company']}_investment_memo.txt")
-    with open(memo_path, 'w') as f:
-        f.write(memo)
+    file_prefix = safe_filename(data.company)
+    memo_path = os.path.join('data/memos', f"{file_prefix}_investment_memo.txt")
+    Path(memo_path).write_text(memo, encoding='utf-8', newline='\n')
     print(f"Memo saved to {memo_path}")
     
     # Save structured data as JSON for analysis
-    json_path = os.path.join('data/memos', f"{data['company']}_structured_data.json")
-    with open(json_path, 'w') as f:
-        f.write(company_doc.model_dump_json(indent=2))
+    json_path = os.path.join('data/memos', f"{file_prefix}_structured_data.json")
+    Path(json_path).write_text(company_doc.model_dump_json(indent=2), encoding='utf-8', newline='\n')
     print(f"Structured data saved to {json_path}")
 
         # Generate PDF with charts
-    pdf_path = os.path.join('data/memos', f"{data['company'].replace(' ', '_')}_memo.pdf")
-    from utils.pdf_generator import generate_pdf_with_charts
-    generate_pdf_with_charts(memo, pdf_path, company_doc, data['company'])
+    pdf_path = os.path.join('data/memos', f"{file_prefix}_memo.pdf")
+    try:
+        chart_paths = charts_future.result()
+    finally:
+        chart_pool.shutdown()
+    generate_pdf(memo, pdf_path, chart_paths=chart_paths)
     print(f"PDF with charts saved to {pdf_path}")
 
 if __name__ == "__main__":
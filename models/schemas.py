@@ -1,6 +1,7 @@
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, HttpUrl, Field, PrivateAttr
 from typing import List, Optional, Dict
 from datetime import datetime
+import hashlib
 
 class Citation(BaseModel):
     url: HttpUrl
@@ -36,26 +37,49 @@ class StructuredCompanyDoc(BaseModel):
     timing: Section = Field(default_factory=Section)
     moat: Section = Field(default_factory=Section)
     recommendations: Section = Field(default_factory=Section)
+    # Set on placeholder docs built when analysis failed; private, so it is never serialized
+    _is_fallback: bool = PrivateAttr(default=False)
+    # Digest of the serialized doc, computed on first use and dropped when a field is reassigned
+    _content_hash: Optional[bytes] = PrivateAttr(default=None)
+    
+    def __setattr__(self, name, value):
+        if not name.startswith('_'):
+            self._content_hash = None
+        super().__setattr__(name, value)
+    
+    @property
+    def is_fallback(self) -> bool:
+        """Whether this is a placeholder for a failed analysis rather than real findings"""
+        return self._is_fallback
+    
+    def content_hash(self) -> bytes:
+        """SHA-256 of the doc's JSON; assumes sections are replaced, not edited in place"""
+        if self._content_hash is None:
+            self._content_hash = hashlib.sha256(self.model_dump_json().encode()).digest()
+        return self._content_hash
     
     def get_populated_sections(self) -> Dict[str, Section]:
         """Return only sections that have content"""
-        populated = {}
-        for field_name, section in self.dict().items():
-            if isinstance(section, dict) and field_name not in ['name', 'website', 'contact', 'missing_fields']:
-                section_obj = Section(**section)
-                if section_obj.has_content():
-                    populated[field_name] = section_obj
-        return populated
+        # Read the live Section fields directly instead of dumping and revalidating them
+        return {
+            field_name: section
+            for field_name, section in self.__dict__.items()
+            if isinstance(section, Section) and section.has_content()
+        }
     
     def get_missing_fields(self) -> List[str]:
         """Return field names that have no content"""
-        missing = []
-        for field_name, section in self.dict().items():
-            if isinstance(section, dict) and field_name not in ['name', 'website', 'contact', 'missing_fields']:
-                section_obj = Section(**section)
-                if not section_obj.has_content():
-                    missing.append(field_name)
-        return missing
+        return [
+            field_name
+            for field_name, section in self.__dict__.items()
+            if isinstance(section, Section) and not section.has_content()
+        ]
+
+class AgentInput(BaseModel):
+    """Company to analyze in a main_agent run, as read from data/test_input.json"""
+    company: str
+    website: str
+    founder: Optional[str] = None
 
 class RawDoc(BaseModel):
     """Raw document from web scraping"""
@@ -63,4 +87,34 @@ class RawDoc(BaseModel):
     title: str
     text: str
     source_type: str
-    timestamp: datetime 
\ No newline at end of file
+    timestamp: datetime
+
+class SectionPayload(BaseModel):
+    """One memo section as returned by GPT section extraction"""
+    text: str
+    bullets: List[str]
+    citation: str
+
+class ExtractionResult(BaseModel):
+    """Structured-output schema for GPT section extraction; absent sections are null"""
+    introduction: Optional[SectionPayload] = None
+    problem: Optional[SectionPayload] = None
+    solution: Optional[SectionPayload] = None
+    product: Optional[SectionPayload] = None
+    traction: Optional[SectionPayload] = None
+    business_model: Optional[SectionPayload] = None
+    market: Optional[SectionPayload] = None
+    team: Optional[SectionPayload] = None
+    competition: Optional[SectionPayload] = None
+    funding: Optional[SectionPayload] = None
+    financials: Optional[SectionPayload] = None
+    why_now: Optional[SectionPayload] = None
+
+class ChunkExtractionResult(BaseModel):
+    """Sections extracted from one numbered chunk of a batched extraction request"""
+    chunk: int
+    sections: ExtractionResult
+
+class BatchExtractionResult(BaseModel):
+    """Structured-output schema for extracting sections from several chunks in one request"""
+    chunks: List[ChunkExtractionResult]
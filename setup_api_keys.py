@@ -100,9 +100,11 @@ def setup_api_keys():
     print("\n🧪 Testing Configuration")
     print("-" * 30)
     
-    # Reload environment
-    from dotenv import load_dotenv
-    load_dotenv()
+    # Apply the keys to this process directly; .env has just been written with the same values
+    if openai_key:
+        os.environ["OPENAI_API_KEY"] = openai_key
+    if serpapi_key:
+        os.environ["SERPAPI_KEY"] = serpapi_key
     
     # Test OpenAI
     if os.getenv("OPENAI_API_KEY"):
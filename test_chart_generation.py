@@ -7,12 +7,14 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from utils.chart_generator import generate_charts, extract_market_numbers, extract_funding_data, extract_traction_data
 from models.schemas import StructuredCompanyDoc, Section
 from datetime import datetime
 
 def test_chart_generation():
     """Test chart generation with sample data"""
+    # chart_generator imports matplotlib, so only load it when the test runs
+    from utils.chart_generator import generate_charts, extract_market_numbers, extract_funding_data, extract_traction_data
+    
     print("🧪 Testing Chart Generation...")
     
     # Create sample structured document with chart-worthy data
@@ -58,8 +60,7 @@ def test_chart_generation():
     
     # Test market number extraction
     print("🔍 Testing market number extraction...")
-    market_text = test_doc.market.text + " " + " ".join(test_doc.market.bullets)
-    market_data = extract_market_numbers(market_text)
+    market_data = extract_market_numbers(test_doc.market.text, *test_doc.market.bullets)
     print(f"   Extracted market data: {market_data}")
     
     # Test funding data extraction
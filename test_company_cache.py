@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Test script to verify failed company analyses are not cached.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_fallback_memo_not_cached():
+    """An OpenAI failure yields an insufficient-data memo that must not reach the cache"""
+    import agents.company_researcher as company_researcher
+    
+    print("🧪 Testing that fallback memos are not cached...")
+    
+    def failing_client():
+        raise RuntimeError("OpenAI unavailable")
+    
+    original_dir = company_researcher.COMPANY_CACHE_DIR
+    original_client = company_researcher._get_openai_client
+    with tempfile.TemporaryDirectory() as cache_dir:
+        company_researcher.COMPANY_CACHE_DIR = cache_dir
+        company_researcher._get_openai_client = failing_client
+        try:
+            researcher = company_researcher.CompanyResearcher()
+            researcher.search_verifiable_sources = lambda company_name: []
+            
+            company_doc = researcher.analyze_company("Uncached Startup", "https://example.com")
+            
+            assert company_doc.is_fallback
+            assert company_doc.get_populated_sections(), "fallback memo should still be shown"
+            assert not os.listdir(cache_dir), "fallback memo was written to the company cache"
+        finally:
+            company_researcher.COMPANY_CACHE_DIR = original_dir
+            company_researcher._get_openai_client = original_client
+    
+    print("✅ Fallback memo was returned but not cached")
+    return True
+
+if __name__ == "__main__":
+    test_fallback_memo_not_cached()
@@ -5,26 +5,45 @@ Test script to verify dynamic team information functionality.
 
 import sys
 import os
+import asyncio
 from pathlib import Path
 
 # Add the project root to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Companies looked up at once; get_founder_team_info also caps its own OpenAI calls
+MAX_CONCURRENT_COMPANIES = 5
+
+async def get_team_infos(test_companies):
+    """Fetch team info for all companies concurrently; returns each section, or the exception it raised, in order"""
+    from agents.founder_profiler import get_founder_team_info
+    
+    sem = asyncio.Semaphore(MAX_CONCURRENT_COMPANIES)
+    loop = asyncio.get_running_loop()
+    
+    async def lookup(company_name):
+        async with sem:
+            return await loop.run_in_executor(None, get_founder_team_info, company_name)
+    
+    return await asyncio.gather(*(lookup(company_name) for company_name in test_companies), return_exceptions=True)
+
 def test_dynamic_team():
     """Test the dynamic team information functionality"""
     print("🧪 Testing Dynamic Team Information...")
     
     try:
-        from agents.founder_profiler import get_founder_team_info
-        
         # Test companies
         test_companies = ["Canva", "Figma", "Notion", "Stripe", "Airbnb"]
         
-        for company_name in test_companies:
+        # Look up all companies concurrently, then report on each in order
+        results = asyncio.run(get_team_infos(test_companies))
+        
+        for company_name, team_section in zip(test_companies, results):
             print(f"\n📊 Testing {company_name}...")
             
             try:
-                team_section = get_founder_team_info(company_name)
+                if isinstance(team_section, Exception):
+                    raise team_section
                 
                 if team_section.has_content():
                     print(f"   ✅ Team info retrieved")
@@ -14,9 +14,10 @@ def test_enhanced_analysis():
     """Test the enhanced GPT-4 analysis"""
     print("🧪 Testing Enhanced GPT-4 Analysis...")
     
-    # Load environment variables
-    from dotenv import load_dotenv
-    load_dotenv()
+    # Only read .env when the key isn't already in the environment
+    if not os.environ.get("OPENAI_API_KEY"):
+        from dotenv import load_dotenv
+        load_dotenv()
     
     try:
         # Check if OpenAI API key is available
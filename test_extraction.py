@@ -4,11 +4,25 @@ Test script to demonstrate the improved text extraction pipeline
 """
 
 import json
-from agents.company_researcher import CompanyResearcher
-from models.schemas import StructuredCompanyDoc
+import asyncio
+
+# Companies analyzed at once; bounded to stay within search and OpenAI rate limits
+MAX_CONCURRENT_COMPANIES = 5
+
+async def analyze_companies(researcher, test_companies):
+    """Analyze all companies concurrently; returns each company_doc, or the exception it raised, in order"""
+    sem = asyncio.Semaphore(MAX_CONCURRENT_COMPANIES)
+    loop = asyncio.get_running_loop()
+    
+    async def analyze(company):
+        async with sem:
+            return await loop.run_in_executor(None, researcher.analyze_company, company['name'], company['website'])
+    
+    return await asyncio.gather(*(analyze(company) for company in test_companies), return_exceptions=True)
 
 def test_extraction():
     """Test the extraction pipeline with a sample company"""
+    from agents.company_researcher import get_researcher
     
     # Test with a smaller company that might have more detailed info
     test_companies = [
@@ -17,16 +31,19 @@ def test_extraction():
         {"name": "Airtable", "website": "https://airtable.com"}
     ]
     
-    researcher = CompanyResearcher()
+    researcher = get_researcher()
+    
+    # Analyze all companies concurrently, then report on each in order
+    results = asyncio.run(analyze_companies(researcher, test_companies))
     
-    for company in test_companies:
+    for company, company_doc in zip(test_companies, results):
         print(f"\n{'='*60}")
         print(f"Testing: {company['name']}")
         print(f"{'='*60}")
         
         try:
-            # Analyze company
-            company_doc = researcher.analyze_company(company['name'], company['website'])
+            if isinstance(company_doc, Exception):
+                raise company_doc
             
             # Show populated sections
             populated = company_doc.get_populated_sections()
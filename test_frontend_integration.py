@@ -7,20 +7,19 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from agents.company_researcher import CompanyResearcher
-from agents.memo_generator import generate_memo
-from models.schemas import StructuredCompanyDoc
-
 def test_frontend_integration():
     """Test that frontend can import and use backend components"""
     print("🧪 Testing Frontend Integration...")
     
     try:
         # Test 1: Import components
+        from agents.company_researcher import get_researcher
+        from agents.memo_generator import generate_memo
+        from models.schemas import StructuredCompanyDoc
         print("✅ Successfully imported backend components")
         
-        # Test 2: Create CompanyResearcher
-        researcher = CompanyResearcher()
+        # Test 2: Get the shared CompanyResearcher
+        researcher = get_researcher()
         print("✅ Successfully created CompanyResearcher")
         
         # Test 3: Test with a simple company
@@ -5,23 +5,68 @@ Test script to verify full system integration.
 
 import sys
 import os
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add the project root to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Research calls run at once; bounded to stay within search and OpenAI rate limits
+MAX_CONCURRENT_LOOKUPS = 5
+
+async def process_company(company, sem, render_pool):
+    """
+    Run one company through research, memo, PDF and chart generation.
+    Returns a dict of each stage's result, or the exception it raised.
+    """
+    from agents.company_researcher import get_researcher
+    from agents.founder_profiler import get_founder_team_info
+    from agents.memo_generator import generate_memo_async
+    from utils.pdf_generator import generate_pdf_with_charts
+    from utils.chart_generator import generate_charts_for_memo
+    from utils.paths import safe_filename
+    
+    loop = asyncio.get_running_loop()
+    
+    async def bounded(func, *args):
+        async with sem:
+            return await loop.run_in_executor(None, func, *args)
+    
+    company_doc, team_section = await asyncio.gather(
+        bounded(get_researcher().analyze_company, company['name'], company['website']),
+        bounded(get_founder_team_info, company['name']),
+        return_exceptions=True
+    )
+    result = {"company_doc": company_doc, "team_section": team_section}
+    if isinstance(company_doc, Exception):
+        return result
+    
+    memo = result["memo"] = await generate_memo_async(company_doc)
+    
+    # matplotlib is not thread-safe, so PDFs and charts render in worker processes
+    pdf_path = result["pdf_path"] = f"data/memos/{safe_filename(company['name'])}_test_memo.pdf"
+    result["pdf"], result["chart_paths"] = await asyncio.gather(
+        loop.run_in_executor(render_pool, generate_pdf_with_charts, memo, pdf_path, company_doc, company['name']),
+        loop.run_in_executor(render_pool, generate_charts_for_memo, company['name'], company_doc),
+        return_exceptions=True
+    )
+    return result
+
+async def process_companies(test_companies):
+    """Pipeline every company at once, sharing the lookup semaphore and render pool"""
+    sem = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+    with ProcessPoolExecutor() as render_pool:
+        return await asyncio.gather(
+            *(process_company(company, sem, render_pool) for company in test_companies),
+            return_exceptions=True
+        )
+
 def test_full_integration():
     """Test the full system integration"""
     print("🚀 Starting Full System Integration Tests...")
     
     try:
-        from agents.company_researcher import CompanyResearcher
-        from agents.memo_generator import generate_memo
-        from models.schemas import StructuredCompanyDoc, Section
-        from utils.pdf_generator import generate_pdf_with_charts
-        from agents.founder_profiler import get_founder_team_info
-        from utils.chart_generator import generate_charts_for_memo
-        
         # Test companies
         test_companies = [
             {"name": "Canva", "website": "https://www.canva.com"},
@@ -29,52 +74,51 @@ def test_full_integration():
             {"name": "Notion", "website": "https://www.notion.so"}
         ]
         
-        for company in test_companies:
+        # All companies move through the pipeline together; results are reported in order
+        results = asyncio.run(process_companies(test_companies))
+        
+        for company, result in zip(test_companies, results):
             print(f"\n🧪 Testing {company['name']}...")
             
             try:
+                if isinstance(result, Exception):
+                    raise result
+                
                 # Test company research
-                researcher = CompanyResearcher()
-                company_doc = researcher.analyze_company(
-                    company['name'], 
-                    company['website']
-                )
+                company_doc = result["company_doc"]
+                if isinstance(company_doc, Exception):
+                    raise company_doc
                 
                 print(f"   ✅ Company research completed")
                 print(f"      • Company: {company_doc.name}")
                 print(f"      • Populated sections: {len(company_doc.get_populated_sections())}")
                 
                 # Test memo generation
-                memo = generate_memo(company_doc)
-                print(f"   ✅ Memo generated: {len(memo)} characters")
+                print(f"   ✅ Memo generated: {len(result['memo'])} characters")
                 
                 # Test PDF generation
-                try:
-                    pdf_path = f"data/memos/{company['name'].replace(' ', '_')}_test_memo.pdf"
-                    generate_pdf_with_charts(memo, pdf_path, company_doc, company['name'])
-                    print(f"   ✅ PDF generated: {pdf_path}")
-                except Exception as e:
-                    print(f"   ⚠️ PDF generation failed: {e}")
+                if isinstance(result["pdf"], Exception):
+                    print(f"   ⚠️ PDF generation failed: {result['pdf']}")
+                else:
+                    print(f"   ✅ PDF generated: {result['pdf_path']}")
                 
                 # Test chart generation
-                try:
-                    chart_paths = generate_charts_for_memo(company['name'], company_doc)
-                    if chart_paths:
-                        print(f"   ✅ Charts generated: {len(chart_paths)} charts")
-                    else:
-                        print(f"   ⚠️ No charts generated (insufficient data)")
-                except Exception as e:
-                    print(f"   ⚠️ Chart generation failed: {e}")
+                chart_paths = result["chart_paths"]
+                if isinstance(chart_paths, Exception):
+                    print(f"   ⚠️ Chart generation failed: {chart_paths}")
+                elif chart_paths:
+                    print(f"   ✅ Charts generated: {len(chart_paths)} charts")
+                else:
+                    print(f"   ⚠️ No charts generated (insufficient data)")
                 
                 # Test dynamic team info
-                try:
-                    team_section = get_founder_team_info(company['name'])
-                    if team_section.has_content():
-                        print(f"   ✅ Team info retrieved: {len(team_section.text)} chars")
-                    else:
-                        print(f"   ⚠️ No team info available")
-                except Exception as e:
-                    print(f"   ⚠️ Team info failed: {e}")
+                team_section = result["team_section"]
+                if isinstance(team_section, Exception):
+                    print(f"   ⚠️ Team info failed: {team_section}")
+                elif team_section.has_content():
+                    print(f"   ✅ Team info retrieved: {len(team_section.text)} chars")
+                else:
+                    print(f"   ⚠️ No team info available")
                 
             except Exception as e:
                 print(f"   ❌ Failed to analyze {company['name']}: {e}")
@@ -5,7 +5,15 @@ Note: Requires SERPAPI_KEY environment variable
 """
 
 import os
-from agents.company_researcher import CompanyResearcher
+import asyncio
+from agents.company_researcher import get_researcher
+
+async def analyze_companies(researcher, test_companies):
+    """Analyze all companies concurrently; returns each company_doc, or the exception it raised, in order"""
+    async def analyze(company):
+        return await asyncio.to_thread(researcher.analyze_company, company['name'], company['website'])
+    
+    return await asyncio.gather(*(analyze(company) for company in test_companies), return_exceptions=True)
 
 def test_google_integration():
     """Test the Google search integration"""
@@ -20,7 +28,7 @@ def test_google_integration():
         # Test with website-only analysis
         test_company = {"name": "Linear", "website": "https://linear.app"}
         
-        researcher = CompanyResearcher()
+        researcher = get_researcher()
         try:
             company_doc = researcher.analyze_company(test_company['name'], test_company['website'])
             
@@ -43,16 +51,21 @@ def test_google_integration():
         {"name": "Figma", "website": "https://figma.com"}
     ]
     
-    researcher = CompanyResearcher()
+    # Shared researcher, so its pooled HTTP session is reused across companies and tests
+    researcher = get_researcher()
+    
+    # Analyze all companies concurrently, then report on each in order
+    results = asyncio.run(analyze_companies(researcher, test_companies))
     
-    for company in test_companies:
+    for company, company_doc in zip(test_companies, results):
         print(f"\n{'='*60}")
         print(f"Testing Google integration: {company['name']}")
         print(f"{'='*60}")
         
         try:
             # Analyze company with Google search
-            company_doc = researcher.analyze_company(company['name'], company['website'])
+            if isinstance(company_doc, Exception):
+                raise company_doc
             
             # Show populated sections
             populated = company_doc.get_populated_sections()
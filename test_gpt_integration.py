@@ -5,9 +5,11 @@ Test script to verify GPT-4 integration with section extraction.
 
 import sys
 import os
+import asyncio
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from llm.section_extractor import extract_sections_with_gpt
+from llm.section_extractor import aextract_sections_with_gpt
+from llm.response_cache import llm_cache_enabled
 from models.schemas import RawDoc
 from datetime import datetime
 
@@ -44,7 +46,9 @@ def test_gpt_integration():
         
         # Test GPT-4 extraction
         print("🔍 Testing GPT-4 extraction for 'Canva'...")
-        sections = extract_sections_with_gpt("Canva", test_docs)
+        # With LLM_CACHE=1, reuse the extractor's per-chunk cache so repeat runs skip the API
+        cache_dir = "cache" if llm_cache_enabled() else None
+        sections = asyncio.run(aextract_sections_with_gpt("Canva", test_docs, cache_dir=cache_dir))
         
         if sections:
             print("✅ GPT-4 extraction successful!")
@@ -5,9 +5,24 @@ Note: Requires SERPAPI_KEY environment variable
 """
 
 import os
-from agents.company_researcher import CompanyResearcher
+import asyncio
+from agents.company_researcher import get_researcher
 from agents.founder_profiler import evaluate_founder
 
+async def research_companies(researcher, test_companies):
+    """
+    Run the founder profile and company analysis for all companies concurrently.
+    Returns (founder_data or exception, company_doc or exception) per company, in order.
+    """
+    async def research(company):
+        return await asyncio.gather(
+            asyncio.to_thread(evaluate_founder, company['founder'], company['name']),
+            asyncio.to_thread(researcher.analyze_company, company['name'], company['website'], company['founder']),
+            return_exceptions=True
+        )
+    
+    return await asyncio.gather(*(research(company) for company in test_companies))
+
 def test_linkedin_integration():
     """Test the LinkedIn team extraction integration via founder profiler"""
     
@@ -21,7 +36,7 @@ def test_linkedin_integration():
         # Test with mock LinkedIn data
         test_company = {"name": "Linear", "website": "https://linear.app", "founder": "Karri Saarinen"}
         
-        researcher = CompanyResearcher()
+        researcher = get_researcher()
         try:
             company_doc = researcher.analyze_company(
                 test_company['name'], 
@@ -57,9 +72,13 @@ def test_linkedin_integration():
         {"name": "Notion", "website": "https://notion.so", "founder": "Ivan Zhao"}
     ]
     
-    researcher = CompanyResearcher()
+    # Shared researcher, so its pooled HTTP session is reused across companies and tests
+    researcher = get_researcher()
+    
+    # Research all companies concurrently, then report on each in order
+    results = asyncio.run(research_companies(researcher, test_companies))
     
-    for company in test_companies:
+    for company, (founder_data, company_doc) in zip(test_companies, results):
         print(f"\n{'='*60}")
         print(f"Testing LinkedIn integration: {company['name']}")
         print(f"{'='*60}")
@@ -67,7 +86,8 @@ def test_linkedin_integration():
         try:
             # Test founder profiler separately first
             print(f"\n🔍 Testing founder profiler with LinkedIn...")
-            founder_data = evaluate_founder(company['founder'], company['name'])
+            if isinstance(founder_data, Exception):
+                raise founder_data
             
             if founder_data.get('team') and founder_data['team'].bullets:
                 print(f"✅ Found {len(founder_data['team'].bullets)} team members:")
@@ -78,11 +98,8 @@ def test_linkedin_integration():
             
             # Now test full integration
             print(f"\n🔍 Testing full company analysis...")
-            company_doc = researcher.analyze_company(
-                company['name'], 
-                company['website'], 
-                company['founder']
-            )
+            if isinstance(company_doc, Exception):
+                raise company_doc
             
             # Show populated sections
             populated = company_doc.get_populated_sections()
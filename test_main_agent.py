@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Test script to verify main_agent renders charts in a worker process.
+"""
+
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.schemas import StructuredCompanyDoc, Section
+
+def test_render_charts_in_pool():
+    """Run render_charts through a process pool, as run_main_agent does"""
+    from main_agent import render_charts
+    
+    print("🧪 Testing chart rendering in a worker process...")
+    
+    test_doc = StructuredCompanyDoc(name="Pool Test Company")
+    test_doc.market = Section(
+        text="The total addressable market (TAM) is estimated at $50 billion, with a serviceable addressable market (SAM) of $10 billion.",
+        bullets=["TAM: $50B", "SAM: $10B"],
+        citations=[]
+    )
+    
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        chart_paths = pool.submit(render_charts, test_doc.name, test_doc).result()
+    
+    assert isinstance(chart_paths, dict)
+    for chart_type, path in chart_paths.items():
+        assert os.path.exists(path), f"{chart_type} chart missing at {path}"
+    print(f"✅ Worker rendered {len(chart_paths)} charts")
+    return True
+
+if __name__ == "__main__":
+    test_render_charts_in_pool()
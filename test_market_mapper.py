@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Test script to verify competitor extraction in the market mapper.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from agents.market_mapper import MarketMapper
+
+def test_competitor_keyword_after_capitalized_word():
+    """A capitalized word before the keyword must not hide the competition context"""
+    print("🧪 Testing competitor extraction...")
+    
+    mapper = MarketMapper()
+    section = mapper.extract_competitors("Major Competitors include Acme Corp and Beta Labs.", [])
+    
+    assert section is not None, "no competitors extracted"
+    assert "Competitors include Acme Corp and Beta Labs" in section.bullets, section.bullets
+    assert "Major Competitors include Acme Corp and Beta Labs" in section.bullets, section.bullets
+    print(f"✅ Extracted {len(section.bullets)} competitor bullets")
+    return True
+
+if __name__ == "__main__":
+    test_competitor_keyword_after_capitalized_word()
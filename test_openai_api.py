@@ -6,6 +6,7 @@ Test script to verify OpenAI API key is working.
 import os
 from dotenv import load_dotenv
 from openai import OpenAI
+from llm.response_cache import cached_chat_completion
 
 # Load environment variables
 load_dotenv()
@@ -26,8 +27,9 @@ def test_openai_api():
         # Create OpenAI client
         client = OpenAI(api_key=api_key)
         
-        # Test with a simple request
-        response = client.chat.completions.create(
+        # Test with a simple request; with LLM_CACHE=1 a repeat run replays the saved reply
+        response = cached_chat_completion(
+            client,
             model="gpt-4-turbo",
             messages=[
                 {
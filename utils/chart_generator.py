@@ -2,10 +2,14 @@ import os
 import re
 import logging
 from typing import Dict, List, Optional, Tuple
+import matplotlib
+# Charts are only ever saved to files, so render off-screen; this also keeps chart workers free of GUI backends
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from datetime import datetime, date
 from models.schemas import StructuredCompanyDoc
+from utils.paths import safe_filename
 
 logger = logging.getLogger(__name__)
 
@@ -16,25 +20,47 @@ plt.rcParams['font.size'] = 10
 plt.rcParams['axes.titlesize'] = 12
 plt.rcParams['axes.labelsize'] = 10
 
-def extract_market_numbers(text: str) -> Dict[str, float]:
-    """Extract market size numbers from text"""
+# Market size patterns, compiled once, with the figure each one reports
+_MARKET_UNIT = r'[:\s]*\$?(\d+(?:\.\d+)?)\s*(million|billion|trillion|M|B|T)'
+_MARKET_PATTERNS = [
+    (re.compile(label + _MARKET_UNIT, re.IGNORECASE), key) for label, key in (
+        (r'TAM', 'TAM'),
+        (r'SAM', 'SAM'),
+        (r'SOM', 'SOM'),
+        (r'Total Addressable Market', 'TAM'),
+        (r'Serviceable Addressable Market', 'SAM'),
+        (r'Serviceable Obtainable Market', 'SOM'),
+    )
+]
+
+# Funding round patterns
+_FUNDING_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'(\d{4})[:\s]*\$?(\d+(?:\.\d+)?)\s*(million|billion|M|B)\s*(Series\s+[A-Z]|Seed|Pre-seed|IPO)',
+        r'Raised\s+\$?(\d+(?:\.\d+)?)\s*(million|billion|M|B)\s*(Series\s+[A-Z]|Seed|Pre-seed|IPO)\s*in\s*(\d{4})',
+        r'(\d{4})[:\s]*(\d+(?:\.\d+)?)\s*(million|billion|M|B)\s*funding',
+    )
+]
+
+# Traction patterns like "1M users in 2021", "5M MAU in 2023"
+_TRACTION_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'(\d+(?:\.\d+)?)\s*(M|K|million|thousand)\s*(users?|MAU|DAU)\s*in\s*(\d{4})',
+        r'(\d+(?:\.\d+)?)\s*(M|K|million|thousand)\s*in\s*(\d{4})',
+    )
+]
+
+_YEAR_RE = re.compile(r'(\d{4})')
+_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+def extract_market_numbers(*texts: str) -> Dict[str, float]:
+    """Extract market size numbers from one or more texts, scanning each in turn without joining them"""
     market_data = {}
     
-    # Patterns for market size extraction
-    patterns = [
-        r'TAM[:\s]*\$?(\d+(?:\.\d+)?)\s*(million|billion|trillion|M|B|T)',
-        r'SAM[:\s]*\$?(\d+(?:\.\d+)?)\s*(million|billion|trillion|M|B|T)',
-        r'SOM[:\s]*\$?(\d+(?:\.\d+)?)\s*(million|billion|trillion|M|B|T)',
-        r'Total Addressable Market[:\s]*\$?(\d+(?:\.\d+)?)\s*(million|billion|trillion|M|B|T)',
-        r'Serviceable Addressable Market[:\s]*\$?(\d+(?:\.\d+)?)\s*(million|billion|trillion|M|B|T)',
-        r'Serviceable Obtainable Market[:\s]*\$?(\d+(?:\.\d+)?)\s*(million|billion|trillion|M|B|T)',
-    ]
+    texts_lower = [text.lower() for text in texts if text]
     
-    text_lower = text.lower()
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text_lower, re.IGNORECASE)
-        for value, unit in matches:
+    for pattern, key in _MARKET_PATTERNS:
+        for value, unit in (match.groups() for text in texts_lower for match in pattern.finditer(text)):
             try:
                 num_value = float(value)
                 # Convert to billions for consistency
@@ -43,12 +69,7 @@ def extract_market_numbers(text: str) -> Dict[str, float]:
                 elif unit.lower() in ['trillion', 't']:
                     num_value *= 1000
                 
-                if 'tam' in pattern.lower() or 'total addressable market' in pattern.lower():
-                    market_data['TAM'] = num_value
-                elif 'sam' in pattern.lower() or 'serviceable addressable market' in pattern.lower():
-                    market_data['SAM'] = num_value
-                elif 'som' in pattern.lower() or 'serviceable obtainable market' in pattern.lower():
-                    market_data['SOM'] = num_value
+                market_data[key] = num_value
                     
             except ValueError:
                 continue
@@ -59,18 +80,11 @@ def extract_funding_data(bullets: List[str]) -> List[Dict[str, any]]:
     """Extract funding data from bullets"""
     funding_data = []
     
-    # Patterns for funding extraction
-    patterns = [
-        r'(\d{4})[:\s]*\$?(\d+(?:\.\d+)?)\s*(million|billion|M|B)\s*(Series\s+[A-Z]|Seed|Pre-seed|IPO)',
-        r'Raised\s+\$?(\d+(?:\.\d+)?)\s*(million|billion|M|B)\s*(Series\s+[A-Z]|Seed|Pre-seed|IPO)\s*in\s*(\d{4})',
-        r'(\d{4})[:\s]*(\d+(?:\.\d+)?)\s*(million|billion|M|B)\s*funding',
-    ]
-    
     for bullet in bullets:
         bullet_lower = bullet.lower()
         
-        for pattern in patterns:
-            matches = re.findall(pattern, bullet_lower, re.IGNORECASE)
+        for pattern in _FUNDING_PATTERNS:
+            matches = pattern.findall(bullet_lower)
             for match in matches:
                 try:
                     if len(match) == 4:  # Year, Amount, Unit, Round
@@ -83,7 +97,7 @@ def extract_funding_data(bullets: List[str]) -> List[Dict[str, any]]:
                         unit = match[1]
                         round_type = match[2]
                         # Try to extract year from the bullet
-                        year_match = re.search(r'(\d{4})', bullet)
+                        year_match = _YEAR_RE.search(bullet)
                         year = int(year_match.group(1)) if year_match else datetime.now().year
                     else:
                         continue
@@ -111,8 +125,8 @@ def extract_traction_data(metrics: Dict[str, str], bullets: List[str]) -> List[D
     # Extract from metrics
     for metric, value in metrics.items():
         # Look for year and number in the value
-        year_match = re.search(r'(\d{4})', value)
-        number_match = re.search(r'(\d+(?:\.\d+)?)', value)
+        year_match = _YEAR_RE.search(value)
+        number_match = _NUMBER_RE.search(value)
         
         if year_match and number_match:
             try:
@@ -139,14 +153,8 @@ def extract_traction_data(metrics: Dict[str, str], bullets: List[str]) -> List[D
     
     # Extract from bullets
     for bullet in bullets:
-        # Look for patterns like "1M users in 2021", "5M MAU in 2023"
-        patterns = [
-            r'(\d+(?:\.\d+)?)\s*(M|K|million|thousand)\s*(users?|MAU|DAU)\s*in\s*(\d{4})',
-            r'(\d+(?:\.\d+)?)\s*(M|K|million|thousand)\s*in\s*(\d{4})',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, bullet, re.IGNORECASE)
+        for pattern in _TRACTION_PATTERNS:
+            matches = pattern.findall(bullet)
             for match in matches:
                 try:
                     number = float(match[0])
@@ -321,18 +329,18 @@ def generate_charts(structured_doc: StructuredCompanyDoc, output_dir: str) -> Di
         market_text = structured_doc.market.text or ""
         market_bullets = structured_doc.market.bullets or []
         
-        # Combine text and bullets for market data extraction
-        market_content = market_text + " " + " ".join(market_bullets)
-        market_data = extract_market_numbers(market_content)
+        # Scan the text and each bullet for market data
+        market_data = extract_market_numbers(market_text, *market_bullets)
         
         if market_data and len(market_data) >= 2:
             market_path = os.path.join(output_dir, "market_chart.png")
             if create_market_chart(market_data, market_path):
                 chart_paths["market"] = market_path
     
-    # Generate funding chart
-    if structured_doc.funding and structured_doc.funding.has_content():
-        funding_bullets = structured_doc.funding.bullets or []
+    # Generate funding chart; StructuredCompanyDoc has no funding section, so read it defensively
+    funding = getattr(structured_doc, 'funding', None)
+    if funding and funding.has_content():
+        funding_bullets = funding.bullets or []
         funding_data = extract_funding_data(funding_bullets)
         
         if funding_data:
@@ -365,5 +373,5 @@ def generate_charts_for_memo(company_name: str, structured_doc: StructuredCompan
     Returns:
         Dictionary mapping chart types to file paths
     """
-    output_dir = f"data/memos/{company_name.replace(' ', '_')}_charts"
+    output_dir = f"data/memos/{safe_filename(company_name)}_charts"
     return generate_charts(structured_doc, output_dir) 
\ No newline at end of file
@@ -2,25 +2,24 @@ import os
 import time
 import logging
 import requests
+from functools import lru_cache
 from typing import List, Dict, Optional
 from datetime import datetime
 import trafilatura
 from utils.web_scraper import TextCleaner
+from utils.http_session import get_http_session
 
 logger = logging.getLogger(__name__)
 
 class GoogleSearcher:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         self.api_key = api_key or os.getenv('SERPAPI_KEY')
         if not self.api_key:
             raise ValueError("SERPAPI_KEY not found in environment variables")
         
         self.base_url = "https://serpapi.com/search"
         self.text_cleaner = TextCleaner()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self.session = session or get_http_session()
     
     def search_google(self, company_name: str, queries: List[str]) -> List[Dict]:
         """Perform Google searches for a company and extract content"""
@@ -113,10 +112,15 @@ class GoogleSearcher:
                     logger.error(f"All content extraction attempts failed for {url}")
                     return None
 
-def search_google(company_name: str, queries: List[str]) -> List[Dict]:
+@lru_cache(maxsize=1)
+def _get_searcher() -> GoogleSearcher:
+    """Return a shared GoogleSearcher; a missing key raises, and is not cached, so later calls retry"""
+    return GoogleSearcher()
+
+def search_google(company_name: str, queries: List[str], session: Optional[requests.Session] = None) -> List[Dict]:
     """Main function to search Google for company information"""
     try:
-        searcher = GoogleSearcher()
+        searcher = _get_searcher() if session is None else GoogleSearcher(session=session)
         return searcher.search_google(company_name, queries)
     except Exception as e:
         logger.error(f"Google search failed: {e}")
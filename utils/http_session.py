@@ -0,0 +1,23 @@
+import requests
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+
+# Connection pools per host, and connections kept per pool. Searches and page fetches run
+# in several threads at once, so the pool must be at least that wide to be reused.
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """
+    Return the HTTP session shared by the scrapers and SerpAPI clients, so TCP and TLS
+    connections to SerpAPI and company websites are reused across calls and companies.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+    })
+    return session
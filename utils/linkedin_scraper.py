@@ -3,22 +3,21 @@ import time
 import logging
 import re
 import requests
+from functools import lru_cache
 from typing import List, Dict, Optional
 from datetime import datetime
+from utils.http_session import get_http_session
 
 logger = logging.getLogger(__name__)
 
 class LinkedInScraper:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         self.api_key = api_key or os.getenv('SERPAPI_KEY')
         if not self.api_key:
             raise ValueError("SERPAPI_KEY not found in environment variables")
         
         self.base_url = "https://serpapi.com/search"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self.session = session or get_http_session()
     
     def extract_team_from_linkedin(self, company_name: str) -> List[Dict[str, str]]:
         """Extract team members from LinkedIn using Google search"""
@@ -167,10 +166,15 @@ class LinkedInScraper:
         
         return True
 
+@lru_cache(maxsize=1)
+def _get_scraper() -> LinkedInScraper:
+    """Return a shared LinkedInScraper; a missing key raises, and is not cached, so later calls retry"""
+    return LinkedInScraper()
+
 def extract_team_from_linkedin(company_name: str) -> List[Dict[str, str]]:
     """Main function to extract team members from LinkedIn"""
     try:
-        scraper = LinkedInScraper()
+        scraper = _get_scraper()
         return scraper.extract_team_from_linkedin(company_name)
     except Exception as e:
         logger.error(f"LinkedIn extraction failed: {e}")
@@ -0,0 +1,6 @@
+# Characters that are unsafe in file names on one platform or another, all mapped to '_'
+_FILENAME_TRANSLATION = str.maketrans({char: '_' for char in ' /\\:'})
+
+def safe_filename(name: str) -> str:
+    """Make a company name safe to use as part of a file or directory name"""
+    return name.translate(_FILENAME_TRANSLATION)
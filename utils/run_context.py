@@ -0,0 +1,13 @@
+from contextvars import ContextVar
+from datetime import datetime
+
+# Timestamp shared by every citation created during one memo run
+_memo_run_ts: ContextVar[datetime] = ContextVar("memo_run_ts")
+
+def start_memo_run() -> None:
+    """Start a memo run; citations created from here on share its timestamp"""
+    _memo_run_ts.set(datetime.now())
+
+def run_timestamp() -> datetime:
+    """Return the current memo-run timestamp, falling back to now outside a run"""
+    return _memo_run_ts.get(None) or datetime.now()
@@ -7,6 +7,7 @@ from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 import trafilatura
 from models.schemas import RawDoc
+from utils.http_session import get_http_session
 from datetime import datetime
 import os
 
@@ -121,13 +122,10 @@ class TextCleaner:
         return '\n\n'.join(cleaned_paragraphs)
 
 class WebScraper:
-    def __init__(self, rate_limit_delay: float = 1.0, max_retries: int = 3):
+    def __init__(self, rate_limit_delay: float = 1.0, max_retries: int = 3, session: Optional[requests.Session] = None):
         self.rate_limit_delay = rate_limit_delay
         self.max_retries = max_retries
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self.session = session or get_http_session()
         self.text_cleaner = TextCleaner()
     
     def fetch_page(self, url: str) -> Optional[RawDoc]: